@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Frame background render time.
+
+Renders a MainFrame with the software renderer and measures the frame time
+after a window resize and after a focus change, with the Canvas background
+and with the scene graph (Rectangle) background:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmark.background_render
+
+Each mode runs in its own process, since a process has only one
+QGuiApplication.
+"""
+import os
+import subprocess
+import sys
+import time
+
+from PySide6 import QtCore
+
+# Software renderer, so the background is rasterized on the CPU
+os.environ['QT_QUICK_BACKEND'] = 'software'
+
+from glitch.core import Application
+from glitch.core.application import AppEventFilter
+from glitch.ui.element import Button
+from glitch.ui.frame import MainFrame
+from glitch.ui.layout import Panel
+
+REPEAT = 50
+MODES = 'canvas', 'scene_graph'
+
+
+class View(MainFrame):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.size = 800, 600
+        self.panel = self.add(Panel())
+        for num in range(10):
+            self.add(Button(f'Button {num}'))
+
+
+def frame_time(function: callable, window) -> float:
+    """Mean time of a change and its rendered frame, in milliseconds."""
+    start = time.perf_counter()
+    for num in range(REPEAT):
+        function(num)
+        # The Canvas paints when the pending events are processed
+        QtCore.QCoreApplication.processEvents()
+        window.grabWindow()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def run(mode: str) -> None:
+    """Print the frame times of a mode."""
+    application = Application(
+        View, qml_cache=False, scene_graph=mode == 'scene_graph')
+    frame = application.frame()
+    window = frame._obj
+    objects = frame._objects
+    event_filter = AppEventFilter(
+        frame, objects['mainRect'], frame.style, objects)
+
+    activate = QtCore.QEvent(QtCore.QEvent.WindowActivate)
+    deactivate = QtCore.QEvent(QtCore.QEvent.WindowDeactivate)
+    window.show()
+    window.grabWindow()
+
+    def resize(num: int) -> None:
+        window.setWidth(800 + num % 2 * 100)
+
+    def focus(num: int) -> None:
+        event_filter.eventFilter(window, activate if num % 2 else deactivate)
+
+    print(f'{mode:12} resize: {frame_time(resize, window):6.2f} ms  '
+          f'focus: {frame_time(focus, window):6.2f} ms')
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        run(sys.argv[1])
+        return
+
+    for mode in MODES:
+        subprocess.run(
+            [sys.executable, '-m', 'benchmark.background_render', mode],
+            check=True)
+
+
+if __name__ == '__main__':
+    main()
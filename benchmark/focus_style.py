@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Window focus-switch restyling time.
+
+Loads a MainFrame with 2k Buttons and measures the time to restyle the
+elements when the window is activated and deactivated:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmark.focus_style
+
+"before" restyles every object of the QML tree, like the first
+AppEventFilter, rebuilding the property table and searching the sub-objects
+for each element. "after" is the current AppEventFilter, with the compiled
+style plans of the StyleEngine.
+"""
+import time
+
+from PySide6 import QtCore
+
+from glitch.core import Application
+from glitch.core.application import AppEventFilter
+from glitch.ui.element import Button
+from glitch.ui.frame import MainFrame
+from glitch.ui.layout import Column
+
+COUNT = 2_000
+
+
+class View(MainFrame):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        for num in range(COUNT):
+            if num % 100 == 0:
+                column = self.add(Column())
+            column.add(Button(f'Button {num}'))
+
+
+def change_element_style_state(
+        element: QtCore.QObject, state: str, style: dict) -> None:
+    """The uncompiled style change of each element."""
+    element_properties = {
+        'color': 'font_color',
+        'backgroundColor': 'background_color',
+        'borderColor': 'border_color',
+        'text': {'color': 'font_color'},
+        'background': {
+            'backgroundColor': 'background_color',
+            'borderColor': 'border_color'},
+        'icon': {'opacity': 'icon_opacity'},
+        }
+    name = f'[{element.property("qmlType")}{state}]'
+    if name not in style:
+        return
+
+    for key, value in element_properties.items():
+        if isinstance(value, dict):
+            sub_object = element.findChild(QtCore.QObject, key)
+            if not sub_object:
+                continue
+            for sub_key, sub_value in value.items():
+                if sub_object.property(sub_key) and sub_value in style[name]:
+                    sub_object.setProperty(sub_key, style[name][sub_value])
+        elif element.property(key) and value in style[name]:
+            element.setProperty(key, style[name][value])
+
+
+def before(frame: MainFrame, state: str) -> None:
+    """Restyle every QML object."""
+    main_rect = frame._objects['mainRect']
+    for element in main_rect.findChildren(
+            QtCore.QObject, options=QtCore.Qt.FindChildrenRecursively):
+        change_element_style_state(element, state, frame.style)
+
+
+def best_time(function: callable, repeat: int = 5) -> float:
+    """Lowest time of `repeat` calls, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    application = Application(View, qml_cache=False)
+    frame = application.frame()
+    objects = frame._objects
+    event_filter = AppEventFilter(
+        frame, objects['mainRect'], frame.style, objects)
+
+    activate = QtCore.QEvent(QtCore.QEvent.WindowActivate)
+    deactivate = QtCore.QEvent(QtCore.QEvent.WindowDeactivate)
+
+    def after() -> None:
+        event_filter.eventFilter(frame._obj, deactivate)
+        event_filter.eventFilter(frame._obj, activate)
+
+    old = best_time(lambda: (before(frame, ':inactive'), before(frame, '')))
+    new = best_time(after)
+    print(f'{COUNT} Buttons, deactivate + activate')
+    print(f'  before: {old:8.1f} ms')
+    print(f'  after:  {new:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""QML generation time.
+
+Builds Frame trees with 100, 1k and 10k elements and measures the time to
+write the QML document to a buffer and to a file:
+
+    python -m benchmark.qml_writer
+"""
+import io
+import tempfile
+import time
+
+from glitch.ui.element import Label
+from glitch.ui.frame import MainFrame
+from glitch.ui.layout import Column, Row
+
+
+def build_frame(count: int) -> MainFrame:
+    """MainFrame with `count` Labels, 10 per Row and 100 per Column."""
+    frame = MainFrame()
+    for num in range(count):
+        if num % 100 == 0:
+            column = frame.add(Column())
+        if num % 10 == 0:
+            row = column.add(Row())
+        row.add(Label(f'Label {num}'))
+    return frame
+
+
+def best_time(function: callable, repeat: int = 5) -> float:
+    """Lowest time of `repeat` calls, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def write_file(frame: MainFrame) -> None:
+    """Write the QML document to a temporary file."""
+    with tempfile.TemporaryFile('w') as qml_file:
+        frame._node.write(qml_file)
+
+
+def main() -> None:
+    print(f'{"elements":>10} {"build ms":>10} {"buffer ms":>10} '
+          f'{"file ms":>10} {"lines":>10}')
+    for count in 100, 1_000, 10_000:
+        build = best_time(lambda: build_frame(count), repeat=1)
+        frame = build_frame(count)
+        buffer = best_time(lambda: frame._node.write(io.StringIO()))
+        file = best_time(lambda: write_file(frame))
+        lines = frame._qml.count('\n')
+        print(f'{count:>10} {build:>10.1f} {buffer:>10.1f} '
+              f'{file:>10.1f} {lines:>10}')
+
+
+if __name__ == '__main__':
+    main()
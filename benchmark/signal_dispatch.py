@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Signal creation and dispatch time.
+
+Creates 100k Signals and emits 1M times, with a QObject and its Qt signal
+for each Signal, like the first Signal, and with the current Python
+dispatch:
+
+    python -m benchmark.signal_dispatch
+"""
+import time
+
+from PySide6 import QtCore
+
+from glitch.core import Signal
+
+SIGNALS = 100_000
+EMITS = 1_000_000
+
+
+class QtSignal(QtCore.QObject):
+    """The first Signal, a QObject with a Qt signal for each signal."""
+    __signal = QtCore.Signal()
+
+    def connect(self, callback: callable) -> None:
+        self.__signal.connect(callback)
+
+    def emit(self) -> None:
+        self.__signal.emit()
+
+
+def run(name: str, signal_class: type) -> None:
+    """Print the creation and emit times of a Signal class."""
+    start = time.perf_counter()
+    signals = [signal_class() for _ in range(SIGNALS)]
+    create = time.perf_counter() - start
+
+    calls = [0]
+
+    def callback() -> None:
+        calls[0] += 1
+
+    signal = signals[0]
+    signal.connect(callback)
+    emit = signal.emit
+    start = time.perf_counter()
+    for _ in range(EMITS):
+        emit()
+    dispatch = time.perf_counter() - start
+    assert calls[0] == EMITS
+
+    print(f'{name:8} create 100k: {create * 1000:8.1f} ms  '
+          f'emit 1M: {dispatch * 1000:8.1f} ms')
+
+
+def main() -> None:
+    application = QtCore.QCoreApplication([])
+    run('before', QtSignal)
+    run('after', Signal)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Signal emission time.
+
+Measures the time of a Signal emit with 0, 1 and 3 arguments, and with 1,
+10 and 100 connected functions:
+
+    python -m benchmark.signal_emit
+
+"value" is the way to pass data before the typed signals: the value is set
+on the signal and read back by each function.
+"""
+import time
+
+from PySide6 import QtCore
+
+from glitch.core import Signal
+
+REPEAT = 20_000
+SUBSCRIBERS = 1, 10, 100
+
+
+def emit_time(signal: Signal, args: tuple, repeat: int) -> float:
+    """Mean emit time in microseconds."""
+    emit = signal.emit
+    start = time.perf_counter()
+    for _ in range(repeat):
+        emit(*args)
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def value_time(subscribers: int, repeat: int) -> float:
+    """Mean time to set the value and emit, in microseconds."""
+    signal = Signal()
+    for _ in range(subscribers):
+        signal.connect(lambda: signal.value)
+
+    start = time.perf_counter()
+    for num in range(repeat):
+        signal.value = num
+        signal.emit()
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def main() -> None:
+    application = QtCore.QCoreApplication([])
+    cases = (
+        ('0 args', (), ()),
+        ('1 arg', (object,), (1,)),
+        ('3 args', (int, str, object), (1, 'text', None)))
+
+    print(f'{"":10}' + ''.join(f'{num:>4} subs  ' for num in SUBSCRIBERS))
+    for name, types, args in cases:
+        times = []
+        for subscribers in SUBSCRIBERS:
+            signal = Signal(*types)
+            for _ in range(subscribers):
+                signal.connect(lambda *values: None)
+            times.append(emit_time(signal, args, REPEAT // subscribers))
+        print(f'{name:10}' + ''.join(f'{value:7.2f} us ' for value in times))
+
+    times = [value_time(num, REPEAT // num) for num in SUBSCRIBERS]
+    print(f'{"value":10}' + ''.join(f'{value:7.2f} us ' for value in times))
+
+
+if __name__ == '__main__':
+    main()
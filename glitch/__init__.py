@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-from .core import Application, Cursor, Signal
+from .core import Application, Cursor, Signal, UpdateQueue
 from .enum import Align, Event, FrameHint, FrameShape, Orientation
 from .ui.element import Button, Label
 from .ui.frame import Frame, MainFrame
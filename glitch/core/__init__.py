@@ -2,3 +2,4 @@
 from .application import Application
 from .cursor import Cursor
 from .signal import Signal
+from .update_queue import UpdateQueue
@@ -1,12 +1,20 @@
 #!/usr/bin/env python3
-import sys
+import logging
 import pathlib
+import sys
+import tempfile
 
 from PySide6 import QtCore, QtGui, QtQml, QtQuick
 
 from .handler import Handler
-from .application_shares import change_element_style_state
-from ..ui.base import Element, Frame, Layout
+from .icon_provider import IconProvider
+from .qml_cache import QmlCache
+from .update_queue import UpdateQueue
+from .application_shares import (
+    StyleEngine, set_element_ids, set_scene_graph, set_style_states)
+from ..platform_ import IconResolver
+from ..tools import cache_path
+from ..ui.base import Frame
 
 
 class AppEventFilter(QtCore.QObject):
@@ -17,18 +25,56 @@ class AppEventFilter(QtCore.QObject):
     def __init__(
             self, ui: QtQuick.QQuickWindow,
             main_rect: QtQuick.QQuickItem,
-            style: dict) -> None:
+            style: dict, objects: dict,
+            style_engine: StyleEngine = None) -> None:
         """
         :param main_rect: The main Rectangle inside the Qml-Window.
         :param_style: The Frame and Element style dic.
+        :param objects: The Handler index of QML objects by objectName.
+        :param style_engine: Compiled Element styles, usually the Handler 
+            one. A new one is created if not given.
         """
         super().__init__()
         self.__ui = ui
         self.__main_rect = main_rect
         self.__style = style
-        self.__elements = self.__main_rect.findChildren(
-            QtCore.QObject, options=QtCore.Qt.FindChildrenRecursively)
-    
+        self.__objects = objects
+        self.__style_engine = (
+            style_engine if style_engine else StyleEngine(style, objects))
+
+        # Only styleable elements, grouped by type
+        self.__elements = {}
+        self.add(list(self.__objects.values()))
+
+    def add(self, objects: list) -> None:
+        """Adds QML objects to be styled.
+
+        Only the styleable objects are kept, like the objects created when an 
+        Element is added after the window is rendered.
+
+        :param objects: QML objects.
+        """
+        for element in objects:
+            qml_type = element.property('qmlType')
+            if (element.property('styleStates')
+                    or element.property('listDelegate')):
+                continue
+            if (element.property('baseClass') == 'Element'
+                    or qml_type in ('Panel', 'MainFrame', 'Frame')):
+                self.__elements.setdefault(qml_type, []).append(element)
+
+    def remove(self, objects: list) -> None:
+        """Removes QML objects that are no longer styled.
+
+        :param objects: QML objects.
+        """
+        for element in objects:
+            elements = self.__elements.get(element.property('qmlType'))
+            if elements and element in elements:
+                elements.remove(element)
+                if not elements:
+                    del self.__elements[element.property('qmlType')]
+
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
         """Adapts the style of the elements.
 
@@ -41,6 +87,9 @@ class AppEventFilter(QtCore.QObject):
         elif event.type() == QtCore.QEvent.WindowDeactivate:
             self.__main_rect.setProperty('isActive', 'false')
             self.__state_style(':inactive')
+        elif event.type() == QtCore.QEvent.ThemeChange:
+            # The platform icon theme may have changed
+            IconResolver.shared().invalidate()
         
         return super().eventFilter(obj, event)
 
@@ -53,10 +102,15 @@ class AppEventFilter(QtCore.QObject):
         self.__main_rect.setProperty(
             'borderColor',
             self.__style[frame]['border_color'])
-        self.__main_rect.findChild(QtCore.QObject, 'canvas').requestPaint()
+        if 'canvas' in self.__objects:
+            self.__objects['canvas'].requestPaint()
 
-        for element in self.__elements:  # element.metaObject().className()
-            change_element_style_state(element, state, self.__style)
+        # Only the values that change. A value equal in every state of the 
+        # type (like the border radius) is never set again.
+        # The elements without changes are skipped by the engine.
+        for elements in self.__elements.values():
+            for element in elements:
+                self.__style_engine.apply(element, state, True)
 
     def __str__(self) -> str:
         return "<class 'AppEventFilter'>"
@@ -67,27 +121,68 @@ class Application(object):
 
     Handles the processes necessary for the application to function properly.
     """
-    def __init__(self, frame: Frame = Frame) -> None:
+    def __init__(
+            self, frame: Frame = Frame, qml_in_memory: bool = True,
+            qml_cache: bool = True, qml_states: bool = False,
+            scene_graph: bool = False, pool_size: int = 0,
+            icon_cache: bool = False) -> None:
         """
         :param frame: The Application Frame.
+        :param qml_in_memory: Load the generated QML from memory. If `False`
+            or if loading from memory fails, the QML is written to a file in
+            the user cache directory.
+        :param qml_cache: Reuse the cached file of an identical generated 
+            QML, so the compiled QML is also reused. Has priority over 
+            `qml_in_memory`. Use `False` to disable it.
+        :param qml_states: Element styles as declarative QML states, so the 
+            hover, pressed and inactive styles change without running 
+            Python. Only the elements with callbacks connect to Python.
+        :param scene_graph: Draw the Frame and Panel backgrounds with 
+            Rectangles instead of a Canvas, so color and state changes do 
+            not repaint the window. Requires Qt 6.7 or later.
+        :param pool_size: Maximum number of Elements removed after render 
+            that are kept for reuse, by QML template. Use 0 to destroy them.
+        :param icon_cache: Keep the rasterized library icons as PNG files in 
+            the user cache directory, so the next runs do not parse the SVGs.
         """
         self.__ui = frame()
         self.__path = pathlib.Path(__file__).parent.parent
-
-        self.__qml_code = None
-        self.__qml_code_iterator = 0
-        self.__qml_path = self.__path /'static'/'qml'/'main.qml'
-        self.__write_qml(self.__ui)
-
-        self.__qt_gui_application = QtGui.QGuiApplication(sys.argv)
+        self.__qml_url = QtCore.QUrl.fromLocalFile(
+            str(self.__path / 'static' / 'qml' / 'main.qml'))
+        set_element_ids(self.__ui)
+        if qml_states:
+            set_style_states(self.__ui, self.__ui.style)
+        if scene_graph:
+            set_scene_graph(self.__ui)
+
+        # An existing application is reused, like in the tests
+        self.__qt_gui_application = (
+            QtGui.QGuiApplication.instance()
+            or QtGui.QGuiApplication(sys.argv))
         self.__engine = QtQml.QQmlApplicationEngine()
-        self.__engine.load(self.__qml_path)
+        # Button icons, rasterized once per size and device pixel ratio
+        self.__icon_provider = IconProvider(disk_cache=icon_cache)
+        self.__engine.addImageProvider('icons', self.__icon_provider)
+        if qml_cache:
+            self.__load_qml_cache(self.__ui)
+        elif qml_in_memory:
+            self.__engine.loadData(
+                self.__ui._qml.encode(), self.__qml_url)
+        if not self.__engine.rootObjects():
+            self.__load_qml_file(self.__ui)
         if not self.__engine.rootObjects():
             sys.exit(-1)
 
         self.__gui = self.__engine.rootObjects()[0]
-        self.__main_rect = self.__gui.findChild(QtCore.QObject, 'mainRect')
-        self.__handler = Handler(self.__gui, self.__ui)
+        # Later changes of the nodes are not in the loaded QML
+        self.__ui._node.freeze()
+        self.__handler = Handler(
+            self.__gui, self.__ui, qml_states, scene_graph, pool_size)
+        self.__main_rect = self.__handler.objects()['mainRect']
+        # Elements added after render find the Handler here
+        self.__engine.rootContext().setContextProperty('logic', self.__handler)
+        # Changes from other threads are applied before each frame
+        UpdateQueue.shared().window = self.__gui
 
     def frame(self) -> Frame:
         """The Application Frame.
@@ -102,43 +197,38 @@ class Application(object):
         Manages the processes to start the Application Frame and execute it.
         """
         event_filter = AppEventFilter(
-            self.__ui, self.__main_rect, self.__ui.style)
+            self.__ui, self.__main_rect, self.__ui.style,
+            self.__handler.objects(), self.__handler.style_engine())
         self.__gui.installEventFilter(event_filter)
+        self.__handler.objects_added.connect(event_filter.add)
+        self.__handler.objects_removed.connect(event_filter.remove)
 
-        self.__engine.rootContext().setContextProperty('logic', self.__handler)
         sys.exit(self.__qt_gui_application.exec())
 
-    def __write_qml(self, layout) -> None:
-        # object_id as variable name
-        for attr, value in layout.__dict__.items():
-            if not attr.startswith('_'):
-                gui_attr = getattr(layout, attr)
-                if isinstance(gui_attr, Element):
-                    gui_attr._id = attr
-
-        # Parse QML
-        end = '\n// Close'
-        layout._qml, ui_close = layout._qml.split(end)
-        for element in layout.items():
-            tab = ' ' * 12 if self.__qml_code_iterator == 0 else '    '
-
-            element_close = None
-            if end in element._qml:
-                element_close = element._qml.split(end)[1]
-
-            if isinstance(element, Layout):
-                self.__qml_code_iterator += 1
-                self.__write_qml(element)
-
-            layout._qml += '\n'.join(
-                [tab + x if x else ''
-                for x in element._qml.split(end)[0].split('\n')])
-
-            if element_close:
-                layout._qml += element_close.replace('\n', '\n' + tab)
-
-        self.__qml_code = layout._qml + ui_close
-        self.__qml_path.write_text(self.__qml_code)
+    def __load_qml_cache(self, layout) -> None:
+        # Same QML, same file and compiled code
+        qml_cache = QmlCache()
+        try:
+            qml_path = qml_cache.file(layout._qml)
+        except OSError as error:
+            logging.warning(f'QML cache: {error}')
+            return
+
+        self.__engine.load(qml_path)
+        qml_cache.evict(keep=qml_path)
+
+    def __load_qml_file(self, layout) -> None:
+        # A unique file per launch, so concurrent launches do not race
+        with tempfile.NamedTemporaryFile(
+                'w', suffix='.qml', dir=cache_path('qml'),
+                delete=False) as qml_file:
+            layout._node.write(qml_file)
+
+        qml_path = pathlib.Path(qml_file.name)
+        try:
+            self.__engine.load(qml_path)
+        finally:
+            qml_path.unlink(missing_ok=True)
 
     def __str__(self) -> str:
         return "<class 'Application'>"
@@ -1,43 +1,276 @@
 #!/usr/bin/env python3
 from PySide6 import QtCore
 
+from ..ui.base import Element, Frame, Layout
 
-def change_element_style_state(element, state, style):
-    """Adapts the Element's style based on the Frame's state.
 
-    Iterates through the Element's properties and applies a style 
-    corresponding to the Frame's current state.
+# Element property (or sub-object property) and its style key
+element_properties = {
+    None: {
+        'color': 'font_color',
+        'backgroundColor': 'background_color',
+        'borderColor': 'border_color'},
+    'text': {
+        'color': 'font_color'},
+    'background': {
+        'backgroundColor': 'background_color',
+        'borderColor': 'border_color'},
+    'icon': {
+        'opacity': 'icon_opacity'},
+    }
+
+canvas_types = 'Panel', 'MainFrame', 'Frame'
+
+# Style state and its QML condition, in priority order
+state_conditions = {
+    ':inactive': '!<id>.Window.active',
+    ':clicked': '<id>.pressed === true',
+    ':hover': '<id>.hovered === true',
+    '': 'true',
+    }
+
+
+def style_states(qml_type: str, targets: dict, style: dict) -> str | None:
+    """QML states of the Element style.
+
+    A `states` list with a `PropertyChanges` for each style state of the
+    element type, bound to the `hovered` and `pressed` element properties
+    and to the window `active` flag. The style then changes without Python.
+    The '<id>' is the element id, replaced when the node is rendered.
+
+    :param qml_type: Element type name, like 'Button'.
+    :param targets: Styled properties by target, like `_style_targets`.
+    :param style: The Frame and Element style dict.
+    """
+    style_keys = {
+        name: key for properties in element_properties.values()
+        for name, key in properties.items()}
+
+    states = []
+    for state, condition in state_conditions.items():
+        name = f'[{qml_type}{state}]'
+        if name not in style:
+            continue
+
+        changes = []
+        for target, properties in targets.items():
+            values = [
+                f'{prop}: {style_value(style[name][style_keys[prop]])}'
+                for prop in properties if style_keys[prop] in style[name]]
+            if values:
+                target = f'<id>.{target}' if target else '<id>'
+                changes.append(
+                    '        PropertyChanges {\n'
+                    f'            target: {target}\n'
+                    + ''.join(f'            {value}\n' for value in values)
+                    + '        }\n')
+
+        if changes:
+            states.append(
+                '    State {\n'
+                f'        name: "{state.lstrip(":") or "normal"}"\n'
+                f'        when: {condition}\n'
+                + ''.join(changes)
+                + '    }')
+
+    if not states:
+        return None
+    return 'states: [\n' + ',\n'.join(states) + '\n]'
+
+
+def style_value(value: any) -> str:
+    """Style value as QML code.
+
+    :param value: Style value, like '#333' or 1.0.
+    """
+    return f'"{value}"' if isinstance(value, str) else str(value)
+
+
+def set_element_ids(ui: Element | Layout | Frame, id_: str = '_0') -> None:
+    """Sets the tree path as the id of each element.
+
+    The same Frame always generates the same QML, like '_0_2_1' for the 
+    second item of the third item of the Frame.
+
+    :param ui: Element, Layout or Frame.
+    :param id_: Id of `ui`.
+    """
+    ui._id = id_
+    if isinstance(ui, (Frame, Layout)):
+        for num, element in enumerate(ui.items()):
+            set_element_ids(element, f'{id_}_{num}')
+
+
+def set_scene_graph(ui: Element | Layout | Frame) -> None:
+    """Frame and Panel backgrounds without Canvas.
+
+    :param ui: Element, Layout or Frame.
+    """
+    if hasattr(ui, '_scene_graph'):
+        ui._scene_graph = True
+    if isinstance(ui, (Frame, Layout)):
+        for element in ui.items():
+            set_scene_graph(element)
+
+
+def set_style_states(ui: Element | Layout | Frame, style: dict) -> None:
+    """Writes the style states into the QML of each element.
+
+    :param ui: Element, Layout or Frame.
+    :param style: The Frame and Element style dict.
     """
-    use_canvas = element.property('qmlType') in ['Panel', 'MainFrame', 'Frame']
-    if (element.property('baseClass') != 'Element' and not use_canvas):
+    if isinstance(ui, (Frame, Layout)):
+        for element in ui.items():
+            set_style_states(element, style)
+        return
+    if (not isinstance(ui, Element) or not ui._style_targets
+            or 'styleStates' in ui._node.declarations):
         return
 
-    element_properties = {
-        'color': 'font_color',
-        'backgroundColor': 'background_color',
-        'borderColor': 'border_color',
-        'text': {
-            'color': 'font_color'},
-        'background': {
-            'backgroundColor': 'background_color',
-            'borderColor': 'border_color'},
-        'icon': {
-            'opacity': 'icon_opacity'},
-        }
-
-    name = f'[{element.property('qmlType')}{state}]'
-    for key, value in element_properties.items():
-        if isinstance(value, str):
-            if element.property(key) and value in style[name]:
-                element.setProperty(key, style[name][value])
-        else:
-            base_element = element.findChild(QtCore.QObject, key)
-            if base_element:
-                for key_, value_ in value.items():
-                    if base_element.property(key_) and value_ in style[name]:
-                        base_element.setProperty(
-                            key_, style[name][value_])
-
-    if use_canvas:
-        base_element = element.findChild(QtCore.QObject, 'canvas')
-        base_element.requestPaint()
+    states = style_states(ui._name, ui._style_targets, style)
+    if states:
+        ui._node.declare('styleStates', 'bool', True)
+        ui._node.append(states)
+
+
+class StyleEngine(object):
+    """Compiled Element styles.
+
+    Compiles, once per element type and state, a flat list of
+    (sub-object, property, value) operations, and caches the sub-objects
+    (like 'text', 'background' and 'icon') of each element. Changing the
+    style state of an element is then only a few `setProperty` calls.
+    """
+    def __init__(self, style: dict, objects: dict = None) -> None:
+        """
+        :param style: The Frame and Element style dict.
+        :param objects: The Handler index of QML objects by objectName, used
+            to find the canvas.
+        """
+        self.__style = style
+        self.__objects = objects if objects is not None else {}
+        self.__plans = {}
+        self.__targets = {}
+
+    def apply(
+            self, element: QtCore.QObject, state: str,
+            changes: bool = False) -> None:
+        """Adapts the Element's style based on the Frame's state.
+
+        :param element: QML Element object.
+        :param state: Style state like '', ':hover' or ':inactive'.
+        :param changes: Only the values that differ in other states of the
+            element type. Values equal in every state are not set again.
+        """
+        plan = self.plan(element, state, changes)
+        if not plan:
+            return
+
+        targets = self.__targets[element]
+        for target, name, value in plan:
+            targets[target].setProperty(name, value)
+
+        if targets[-1]:
+            targets[-1].requestPaint()
+
+    def forget(self, element: QtCore.QObject) -> None:
+        """Removes the cached sub-objects of a destroyed element.
+
+        :param element: QML Element object.
+        """
+        self.__targets.pop(element, None)
+
+    def plan(
+            self, element: QtCore.QObject, state: str,
+            changes: bool = False) -> list:
+        """Style operations of the element type in a state.
+
+        List of (sub-object index, property name, value) tuples. A plan
+        is compiled once for each type and set of existing sub-objects, the
+        element is the model of the elements with the same sub-objects.
+
+        :param element: QML Element object.
+        :param state: Style state like '', ':hover' or ':inactive'.
+        :param changes: Only the values that differ in other states.
+        """
+        targets = self.__targets.get(element)
+        if targets is None:
+            targets = self.__element_targets(element)
+
+        # Elements of a type can lack sub-objects, like a Panel without a
+        # 'text' when it has no Label
+        key = (
+            targets[0], tuple(target is not None for target in targets[1:-1]),
+            state, changes)
+        if key not in self.__plans:
+            self.__plans[key] = self.__compile(targets, state, changes)
+        return self.__plans[key]
+
+    def __compile(self, targets: tuple, state: str, changes: bool) -> list:
+        # Flat list of operations of a type in a state
+        qml_type = targets[0]
+        name = f'[{qml_type}{state}]'
+        if not qml_type or name not in self.__style:
+            return []
+
+        values = self.__style[name]
+        states = [
+            values_ for key, values_ in self.__style.items()
+            if key == f'[{qml_type}]' or key.startswith(f'[{qml_type}:')]
+
+        plan = []
+        for index, properties in enumerate(element_properties.values(), 1):
+            target = targets[index]
+            if not target:
+                continue
+
+            meta_object = target.metaObject()
+            for property_name, style_key in properties.items():
+                if (style_key not in values
+                        or meta_object.indexOfProperty(property_name) < 0):
+                    continue
+
+                value = values[style_key]
+                if changes and all(
+                        values_.get(style_key) == value for values_ in states):
+                    continue
+
+                plan.append((index, property_name, value))
+        return plan
+
+    def __element_targets(self, element: QtCore.QObject) -> tuple:
+        # (qmlType, element, text, background, icon, canvas)
+        qml_type = element.property('qmlType')
+        use_canvas = qml_type in canvas_types
+        if element.property('baseClass') != 'Element' and not use_canvas:
+            targets = (None,) * (len(element_properties) + 2)
+            self.__targets[element] = targets
+            return targets
+
+        # The sub-objects of a container are its own, not the ones of the
+        # elements inside it, like the 'text' of a Button in a Panel
+        options = (
+            QtCore.Qt.FindDirectChildrenOnly if use_canvas
+            else QtCore.Qt.FindChildrenRecursively)
+        targets = [qml_type]
+        for sub_object in element_properties:
+            targets.append(
+                element.findChild(QtCore.QObject, sub_object, options)
+                if sub_object else element)
+
+        canvas = None
+        if use_canvas:
+            # The Panel canvas is named after the Panel id
+            name = 'canvas' if qml_type != 'Panel' else (
+                'canvas' + element.objectName())
+            canvas = self.__objects.get(name)
+            if canvas is None:
+                canvas = element.findChild(QtCore.QObject, name)
+        targets.append(canvas)
+
+        targets = tuple(targets)
+        self.__targets[element] = targets
+        return targets
+
+    def __str__(self) -> str:
+        return "<class 'StyleEngine'>"
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+import hashlib
+import logging
+
+from PySide6 import QtCore, QtQml
+
+from ..ui.base.frame import imports
+from ..ui.base.qml_node import QmlNode
+
+
+class ComponentCache(object):
+    """Compiled QML components of the element types.
+
+    Creates the QML objects of Elements and Layouts added after the window
+    is rendered. The components are cached by element type and by the hash
+    of the element QML template, so each template is compiled only once.
+    The next elements reuse the component, and only their literal property
+    values, like a text or a size, are set. Bindings, like `parent.width`,
+    are part of the compiled template.
+
+    With a pool, removed Elements are kept and reused by the next Element of
+    the same template, instead of being destroyed and created again.
+    """
+    def __init__(
+            self, engine: QtQml.QQmlEngine, context: QtQml.QQmlContext,
+            url: QtCore.QUrl, pool_size: int = 0) -> None:
+        """
+        :param engine: The QML engine of the window.
+        :param context: QML context of the window, so its ids are visible.
+        :param url: Base URL of the components.
+        :param pool_size: Maximum number of removed objects kept for reuse, 
+            by template. Use 0 to destroy them.
+        """
+        self.__engine = engine
+        self.__context = context
+        self.__url = url
+        self.__pool_size = pool_size
+        self.__components = {}
+        self.__pools = {}
+        self.__keys = {}
+        self.__numbers = {}
+
+    def create(
+            self, node: QmlNode, parent: QtCore.QObject,
+            object_name: str) -> QtCore.QObject | None:
+        """Creates the QML object of a node.
+
+        A pooled object of the same template is reused if there is one. The 
+        object is added to the parent.
+
+        :param node: Element QmlNode, without the child item nodes.
+        :param parent: Parent QML object, like a ColumnLayout.
+        :param object_name: objectName of the new object.
+        """
+        key = node.type, self.__template_hash(node)
+        pool = self.__pools.get(key)
+        if pool:
+            obj = pool.pop()
+            self.__set_properties(obj, node, None)
+            obj.setProperty('objectName', object_name)
+            obj.setProperty('parent', parent)
+            obj.setParent(parent)
+            return obj
+
+        cached = self.__components.get(key)
+        if cached:
+            component, model = cached
+        else:
+            component, model = self.__component(node), node
+            if component.isError():
+                logging.error(component.errorString())
+                return None
+            self.__components[key] = component, model
+
+        obj = component.beginCreate(self.__context)
+        if obj is None:
+            logging.error(component.errorString())
+            return None
+
+        obj.setProperty('objectName', object_name)
+        self.__set_properties(obj, node, model)
+        obj.setProperty('parent', parent)
+        obj.setParent(parent)
+        component.completeCreate()
+        if self.__pool_size:
+            self.__keys[obj] = key
+        return obj
+
+    def release(self, obj: QtCore.QObject) -> bool:
+        """Removes an object from the window.
+
+        The object is kept in the pool of its template, or is destroyed if 
+        the pool is full or disabled. Returns `True` if the object is kept.
+
+        :param obj: QML object created by this cache.
+        """
+        obj.setProperty('parent', None)
+        key = self.__keys.get(obj)
+        pool = self.__pools.setdefault(key, []) if key else None
+        if pool is not None and len(pool) < self.__pool_size:
+            obj.setParent(None)
+            pool.append(obj)
+            return True
+
+        self.__keys.pop(obj, None)
+        obj.deleteLater()
+        return False
+
+    def __component(self, node: QmlNode) -> QtQml.QQmlComponent:
+        # Compiles the node QML
+        node = node.without([])
+        node.imports = imports
+        component = QtQml.QQmlComponent(self.__engine)
+        component.setData(node.render().encode(), self.__url)
+        return component
+
+    def __literal(self, value: str | QmlNode) -> any:
+        # Python value of a QML literal, or `None` for a binding
+        if isinstance(value, QmlNode):
+            return None
+        if value in ('true', 'false'):
+            return value == 'true'
+        if (len(value) > 1 and value[0] == value[-1] == '"'
+                and '"' not in value[1:-1] and '\\' not in value):
+            return value[1:-1]
+        if value in self.__numbers:
+            return self.__numbers[value]
+
+        # Numbers and bindings, like 30 and 'parent.width', repeat a lot
+        try:
+            number = int(value)
+        except ValueError:
+            try:
+                number = float(value)
+            except ValueError:
+                number = None
+        self.__numbers[value] = number
+        return number
+
+    def __set_properties(
+            self, obj: QtCore.QObject, node: QmlNode,
+            model: QmlNode | None) -> None:
+        # Literal values that differ from the template model, or all the
+        # literal values of a reused object
+        context = None
+        for name, value in node.properties.items():
+            if model is not None and model.properties.get(name) == value:
+                continue
+            literal = self.__literal(value)
+            if literal is None:
+                continue
+
+            if '.' not in name:
+                obj.setProperty(name, literal)
+            else:
+                # Grouped or attached property, like 'Layout.fillWidth'
+                context = context if context else QtQml.qmlContext(obj)
+                QtQml.QQmlProperty(obj, name, context).write(literal)
+
+    def __template_hash(self, node: QmlNode) -> str:
+        # Hash of the node QML without its literal values. Nodes with the 
+        # same template share the component.
+        parts = [node.type, repr(node.declarations)]
+        for name, value in node.properties.items():
+            if isinstance(value, QmlNode):
+                parts.append(f'{name}: {value.render()}')
+            elif self.__literal(value) is None:
+                parts.append(f'{name}: {value}')
+            else:
+                parts.append(name)
+        for child in node.children:
+            parts.append(
+                child.render() if isinstance(child, QmlNode) else child)
+        return hashlib.sha256('\n'.join(parts).encode()).hexdigest()[:16]
+
+    def __str__(self) -> str:
+        return "<class 'ComponentCache'>"
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
-from PySide6 import QtCore, QtQuick
+from PySide6 import QtCore, QtQml, QtQuick
 
-from .application_shares import change_element_style_state
+from .application_shares import (
+    StyleEngine, set_element_ids, set_scene_graph, set_style_states)
+from .component_cache import ComponentCache
 from ..enum import Event
 from ..ui.base import Element, Frame, Layout
 from ..ui.frame import MainFrame
@@ -14,27 +16,193 @@ class Handler(QtCore.QObject):
     initial UI elements, and then sets the style of the elements and the Frame 
     in each state.
     """
+    objects_added = QtCore.Signal(list)
+    objects_removed = QtCore.Signal(list)
 
     def __init__(
-            self, gui: QtQuick.QQuickWindow = None, ui: MainFrame = None
-            ) -> None:
+            self, gui: QtQuick.QQuickWindow = None, ui: MainFrame = None,
+            qml_states: bool = False, scene_graph: bool = False,
+            pool_size: int = 0) -> None:
         """The init receives a QML-based UI and the app's Frame.
 
         :param gui: QML based UI.
         :param ui: The app's Frame.
+        :param qml_states: Elements added later also use QML style states.
+        :param scene_graph: Panels added later also use the scene graph 
+            background.
+        :param pool_size: Maximum number of removed Elements kept for reuse,
+            by QML template. Use 0 to destroy them.
         """
         super().__init__()
         self.__gui = gui
         self.__ui = ui
+        self.__qml_states = qml_states
+        self.__scene_graph = scene_graph
+        self.__pool_size = pool_size
+        self.__components = None
+        self.__next_ids = {}
+        self.__pending = {}
+        self.__style_connected = set()
         
-        self.__main_rect = self.__gui.findChild(QtCore.QObject, 'mainRect')
-        self.__elements = self.__main_rect.findChildren(
+        # A single traversal of the QML object tree
+        self.__elements = self.__gui.findChildren(
             QtCore.QObject, options=QtCore.Qt.FindChildrenRecursively)
+        self.__objects = {}
+        for obj in self.__elements:
+            name = obj.objectName()
+            if name and name not in self.__objects:
+                self.__objects[name] = obj
+
+        self.__main_rect = self.__objects.get('mainRect')
+        self.__style_engine = StyleEngine(self.__ui.style, self.__objects)
 
         self.__gui.windowStateChanged.connect(self.__state_changed)
         self.__init_state_style()
         self.__integrate_graphic_elements(self.__ui)
 
+    def objects(self) -> dict:
+        """QML objects by objectName.
+
+        Index built once when the QML is loaded. Elements, Layouts and the 
+        internal objects like 'mainRect' and 'canvas' are resolved here 
+        instead of searching the QML object tree.
+        """
+        return self.__objects
+
+    def style_engine(self) -> StyleEngine:
+        """Compiled Element styles shared with the AppEventFilter."""
+        return self.__style_engine
+
+    def insert(self, layout, items: list) -> None:
+        """Creates Elements and Layouts after the window is rendered.
+
+        The QML objects are created from a cached component of each element 
+        type and added to the end of the Layout. They are styled and their 
+        callbacks are connected like the initial elements. All the items are 
+        created before the Layout arranges them, so a list of items costs a 
+        single layout pass.
+
+        :param layout: Rendered Layout or Frame.
+        :param items: New Elements and Layouts.
+        """
+        parent = self.__content(layout)
+        if parent is None:
+            # Unloaded content, like a closed lazy Panel. Created on load
+            self.__pending.setdefault(layout._id, []).append((layout, items))
+            return
+
+        # The ids never go down, so an id of a removed item is not reused
+        number = max(
+            [self.__next_ids.get(layout._id, 0)]
+            + [self.__id_number(item) + 1 for item in layout.items()])
+        self.__next_ids[layout._id] = number + len(items)
+
+        objects = []
+        for num, item in enumerate(items, number):
+            set_element_ids(item, f'{layout._id}_{num}')
+            if self.__qml_states:
+                set_style_states(item, self.__ui.style)
+            if self.__scene_graph:
+                set_scene_graph(item)
+            objects.extend(self.__create(item, parent))
+
+        for obj in objects:
+            name = obj.objectName()
+            if name and name not in self.__objects:
+                self.__objects[name] = obj
+            self.__connect_style(obj)
+        for item in items:
+            self.__integrate_graphic_element(item)
+
+        state = '' if self.__main_rect.property('isActive') else ':inactive'
+        for obj in objects:
+            if self.__styled(obj):
+                self.__style_engine.apply(obj, state)
+        self.objects_added.emit(objects)
+
+    def integrate(self, layout) -> None:
+        """Integrates the QML objects created later by a Layout.
+
+        Like the content of a lazy Panel, created when it opens. The objects 
+        are indexed, styled and connected to their callbacks.
+
+        :param layout: Layout whose items were created.
+        """
+        content = self.__content(layout)
+        objects = [content] + content.findChildren(
+            QtCore.QObject, options=QtCore.Qt.FindChildrenRecursively)
+        for obj in objects:
+            name = obj.objectName()
+            if name and name not in self.__objects:
+                self.__objects[name] = obj
+            self.__connect_style(obj)
+        self.__integrate_graphic_elements(layout)
+
+        state = '' if self.__main_rect.property('isActive') else ':inactive'
+        for obj in objects:
+            if self.__styled(obj):
+                self.__style_engine.apply(obj, state)
+        self.objects_added.emit(objects)
+
+        # Items added after render are not part of the loaded QML, also the
+        # ones added to the Layouts inside before the content was loaded
+        for target, items in self.__pending.pop(layout._id, []):
+            self.insert(target, items)
+        for child in self.__layouts(layout):
+            for target, items in self.__pending.pop(child._id, []):
+                self.insert(target, items)
+
+    def forget(self, layout) -> None:
+        """Forgets the QML objects of a Layout's items.
+
+        Used before the items are destroyed by QML, like the content of a 
+        Panel unloaded on close. The items added after render are created 
+        again by the next `integrate`.
+
+        :param layout: Layout whose items will be destroyed.
+        """
+        content = self.__content(layout)
+        if content is None or content is layout._obj:
+            return
+
+        objects = [content] + content.findChildren(
+            QtCore.QObject, options=QtCore.Qt.FindChildrenRecursively)
+        self.__pending[layout._id] = self.__runtime_items(layout)
+        self.__unset_objects(layout)
+
+        for obj in objects:
+            if self.__objects.get(obj.objectName()) is obj:
+                del self.__objects[obj.objectName()]
+            self.__style_engine.forget(obj)
+            self.__style_connected.discard(obj)
+        self.objects_removed.emit(objects)
+
+    def remove(self, items: list) -> None:
+        """Removes Elements and Layouts after the window is rendered.
+
+        The QML objects are destroyed, or kept for reuse if the Handler has 
+        a pool.
+
+        :param items: Rendered Elements and Layouts.
+        """
+        objects = []
+        for item in items:
+            layout_id, _, _ = item._id.rpartition('_')
+            self.__next_ids[layout_id] = max(
+                self.__next_ids.get(layout_id, 0),
+                self.__id_number(item) + 1)
+            objects.extend(self.__release(item))
+        for pending in self.__pending.values():
+            for _, pending_items in pending:
+                pending_items[:] = [
+                    item for item in pending_items if item not in items]
+
+        for obj in objects:
+            if self.__objects.get(obj.objectName()) is obj:
+                del self.__objects[obj.objectName()]
+            self.__style_engine.forget(obj)
+        self.objects_removed.emit(objects)
+
     @QtCore.Slot()
     def connections(self):
         """..."""
@@ -73,7 +241,7 @@ class Handler(QtCore.QObject):
         if not self.__main_rect.property('isActive'):
             return
 
-        change_element_style_state(element, ':clicked', self.__ui.style)
+        self.__style_engine.apply(element, ':clicked')
 
     @QtCore.Slot()
     def __element_hover(self, element: QtQuick.QQuickItem) -> None:
@@ -85,36 +253,145 @@ class Handler(QtCore.QObject):
         else:
             state = '' if is_active else ':inactive'
 
-        change_element_style_state(element, state, self.__ui.style)
+        self.__style_engine.apply(element, state)
+
+    @QtCore.Slot()
+    def __sender_hover(self) -> None:
+        # Hover state colors of the element that sent the signal.
+        self.__element_hover(self.sender())
+
+    @QtCore.Slot()
+    def __sender_pressed(self) -> None:
+        # Pressed state colors of the element that sent the signal.
+        self.__element_pressed(self.sender())
+
+    def __content(self, layout) -> QtCore.QObject:
+        # QML object where the Layout items are, like the Panel column
+        content = layout._node.content
+        if content is layout._node or layout._obj is None:
+            return layout._obj
+        return layout._obj.findChild(QtCore.QObject, content.object_name)
+
+    def __create(self, item, parent: QtCore.QObject) -> list:
+        # QML objects of an item and its children, created from components
+        item_nodes = [
+            child._node for child in item.items()] if isinstance(
+            item, Layout) else []
+        obj = self.__component_cache().create(
+            item._node.without(item_nodes), parent, item._id)
+        if obj is None:
+            return []
+
+        objects = [obj] + obj.findChildren(
+            QtCore.QObject, options=QtCore.Qt.FindChildrenRecursively)
+        item._obj = obj
+        if isinstance(item, Layout):
+            content = self.__content(item)
+            for child in item.items():
+                objects.extend(self.__create(child, content))
+        return objects
+
+    def __runtime_items(self, layout) -> list:
+        # Items added after render, as (layout, items), since they are not
+        # part of the layout QML
+        nodes = layout._node.content.children
+        items = [item for item in layout.items()
+                 if not any(item._node is node for node in nodes)]
+        pending = [(layout, items)] if items else []
+        for item in layout.items():
+            if isinstance(item, Layout) and item not in items:
+                pending.extend(self.__runtime_items(item))
+        return pending
+
+    def __unset_objects(self, layout) -> None:
+        # Items whose QML objects were destroyed
+        for item in layout.items():
+            if isinstance(item, Layout):
+                self.__unset_objects(item)
+            item._obj = None
+
+    def __release(self, item) -> list:
+        # QML objects of an item and its children, released to the pool
+        obj = item._obj
+        if not obj:
+            return []
+
+        objects = []
+        if isinstance(item, Layout):
+            for child in item.items():
+                objects.extend(self.__release(child))
+        objects.append(obj)
+        objects.extend(obj.findChildren(
+            QtCore.QObject, options=QtCore.Qt.FindChildrenRecursively))
+
+        if isinstance(item, Element):
+            # The user callbacks are not reused with the object
+            for event, method in getattr(item, 'callbacks', dict)().items():
+                signal = (obj.clicked if event == Event.MOUSE_PRESS
+                    else obj.hoveredChanged)
+                try:
+                    signal.disconnect(method)
+                except (RuntimeError, TypeError):
+                    pass
+
+        item._obj = None
+        if not self.__component_cache().release(obj):
+            self.__style_connected.discard(obj)
+        return objects
+
+    def __component_cache(self) -> ComponentCache:
+        # Created with the first element added after render
+        if self.__components is None:
+            engine = QtQml.qmlEngine(self.__gui)
+            self.__components = ComponentCache(
+                engine, QtQml.qmlContext(self.__gui), engine.baseUrl(),
+                self.__pool_size)
+        return self.__components
+
+    def __layouts(self, layout) -> list:
+        # Layouts inside a Layout, at any depth
+        layouts = []
+        for item in layout.items():
+            if isinstance(item, Layout):
+                layouts.append(item)
+                layouts.extend(self.__layouts(item))
+        return layouts
+
+    @staticmethod
+    def __id_number(item) -> int:
+        # Position of the item in its Layout when its id was set, or -1 for
+        # an item without a tree id, like one waiting for a lazy Panel
+        number = item._id.rpartition('_')[2]
+        return int(number) if number.isdigit() else -1
+
+    def __integrate_graphic_element(self, element) -> None:
+        # Integration of a graphic element into the MainFrame UI.
+        if isinstance(element, Layout):
+            self.__integrate_graphic_elements(element)
+
+        elif isinstance(element, Element):
+            if hasattr(element, 'callbacks'):
+                callbacks = element.callbacks()
+
+                if Event.MOUSE_PRESS in callbacks:
+                    element.connect(
+                        callbacks[Event.MOUSE_PRESS], Event.MOUSE_PRESS)
+                elif Event.MOUSE_HOVER in callbacks:
+                    element.connect(
+                        callbacks[Event.MOUSE_HOVER], Event.MOUSE_HOVER)
 
     def __integrate_graphic_elements(self, layout) -> None:
         # Integration Frame graphic elements into the MainFrame UI.
-        for attr, value in layout.__dict__.items():
-            if attr.startswith('_') and '__' in attr:
-                continue
-
-            element = getattr(layout, attr)
-            obj_value = self.__gui.findChild(QtCore.QObject, attr)
+        for element in layout.items():
+            obj_value = self.__objects.get(element._id)
             if not obj_value:
                 continue
             element._obj = obj_value
-
-            if isinstance(element, Layout):
-                self.__integrate_graphic_elements(element)
-            
-            elif isinstance(element, Element):
-                if hasattr(element, 'callbacks'):
-                    callbacks = element.callbacks()
-
-                    if Event.MOUSE_PRESS in callbacks:
-                        element.connect(
-                            callbacks[Event.MOUSE_PRESS], Event.MOUSE_PRESS)
-                    elif Event.MOUSE_HOVER in callbacks:
-                        element.connect(
-                            callbacks[Event.MOUSE_HOVER], Event.MOUSE_HOVER)
+            self.__integrate_graphic_element(element)
 
         if isinstance(layout, Frame):
             layout._obj = self.__gui
+            layout._objects = self.__objects
 
     @QtCore.Slot()
     def __init_state_style(self) -> None:
@@ -127,20 +404,35 @@ class Handler(QtCore.QObject):
             self.__state_changed(QtCore.Qt.WindowNoState)
 
         for child in self.__elements:
-            if not child.property('qmlType'):
-                continue
-            
-            if getattr(child, 'clicked', None):
-                child.clicked.connect(self.__element_clicked)
-            if getattr(child, 'hoveredChanged', None):
-                child.hoveredChanged.connect(
-                    lambda child=child: self.__element_hover(child))
-            if getattr(child, 'pressed', None):
-                child.pressed.connect(
-                    lambda child=child: self.__element_pressed(child))
-            if getattr(child, 'released', None):
-                child.released.connect(
-                    lambda child=child: self.__element_hover(child))
+            self.__connect_style(child)
+
+    def __connect_style(self, child: QtCore.QObject) -> None:
+        # Style of an element in the hover and pressed states.
+        if not self.__styled(child):
+            return
+        if child in self.__style_connected:
+            # Reused from the pool
+            return
+        self.__style_connected.add(child)
+
+        if getattr(child, 'clicked', None):
+            child.clicked.connect(self.__element_clicked)
+        # Slots of the Handler, instead of a lambda for each element that 
+        # would keep the element alive. The element is the signal sender.
+        if getattr(child, 'hoveredChanged', None):
+            child.hoveredChanged.connect(self.__sender_hover)
+        if getattr(child, 'pressed', None):
+            child.pressed.connect(self.__sender_pressed)
+        if getattr(child, 'released', None):
+            child.released.connect(self.__sender_hover)
+
+    @staticmethod
+    def __styled(obj: QtCore.QObject) -> bool:
+        # If the Handler styles the object. Not the elements styled by their
+        # QML states, or the rows of a ListScroll created from a template.
+        return bool(
+            obj.property('qmlType') and not obj.property('styleStates')
+            and not obj.property('listDelegate'))
 
     @QtCore.Slot()
     def __state_changed(self, state: QtCore.Qt.WindowState) -> None:
@@ -181,7 +473,8 @@ class Handler(QtCore.QObject):
                     self.__ui.style[frame]['border_color'])
                 self.__main_rect.setProperty('color', "#00000000")
 
-            self.__main_rect.findChild(QtCore.QObject, 'canvas').requestPaint()
+            if 'canvas' in self.__objects:
+                self.__objects['canvas'].requestPaint()
 
     @QtCore.Slot()
     def start_move(self) -> None:
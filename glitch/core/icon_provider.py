@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+import collections
+import hashlib
+import pathlib
+
+from PySide6 import QtCore, QtGui, QtQuick
+
+from ..tools import cache_path
+
+
+class IconProvider(QtQuick.QQuickImageProvider):
+    """Rasterized icons for QML.
+
+    Serves 'image://icons/<path>' sources. Each icon file is rasterized once
+    for each size in device pixels, which is the Image `sourceSize` times the
+    device pixel ratio, and kept in a LRU pixmap cache. The Buttons with the
+    same icon share the pixmap instead of parsing the SVG again.
+
+    With the disk cache, the rasterized icons of the library, in
+    'static/icons', are also written as PNG files in the user cache
+    directory and read from there on the next runs.
+    """
+    def __init__(self, max_size: int = 256, disk_cache: bool = False) -> None:
+        """
+        :param max_size: Maximum number of pixmaps kept in memory.
+        :param disk_cache: Keep the library icons as PNG files in the user
+            cache directory.
+        """
+        super().__init__(QtQuick.QQuickImageProvider.ImageType.Pixmap)
+        self.__max_size = max_size
+        self.__disk_cache = disk_cache
+        self.__static = (
+            pathlib.Path(__file__).parent.parent / 'static' / 'icons')
+        self.__pixmaps = collections.OrderedDict()
+
+    def requestPixmap(
+            self, id_: str, size: QtCore.QSize,
+            requested_size: QtCore.QSize) -> QtGui.QPixmap:
+        """Pixmap of an icon path.
+
+        :param id_: Icon file path.
+        :param size: Set to the size of the pixmap.
+        :param requested_size: Size in device pixels, or an invalid size for
+            the file size.
+        """
+        width = max(requested_size.width(), 0)
+        height = max(requested_size.height(), 0)
+        key = id_, width, height
+        pixmap = self.__pixmaps.get(key)
+        if pixmap is not None:
+            self.__pixmaps.move_to_end(key)
+        else:
+            pixmap = self.__rasterize(id_, width, height)
+            self.__pixmaps[key] = pixmap
+            if len(self.__pixmaps) > self.__max_size:
+                self.__pixmaps.popitem(last=False)
+
+        size.setWidth(pixmap.width())
+        size.setHeight(pixmap.height())
+        return pixmap
+
+    def __disk_path(
+            self, path: pathlib.Path, width: int,
+            height: int) -> pathlib.Path | None:
+        # PNG file of a library icon, or `None` for the other icons
+        if not self.__disk_cache or not path.is_relative_to(self.__static):
+            return None
+
+        # The icon modification time makes an edited icon a new file
+        relative = str(path.relative_to(self.__static))
+        name = hashlib.sha256(
+            f'{relative}:{path.stat().st_mtime_ns}'.encode()).hexdigest()[:16]
+        return cache_path('icons', 'png') / f'{name}-{width}x{height}.png'
+
+    def __rasterize(self, id_: str, width: int, height: int) -> QtGui.QPixmap:
+        # Reads the file, or its PNG from the disk cache
+        path = pathlib.Path(id_)
+        try:
+            png = self.__disk_path(path, width, height)
+        except OSError:
+            png = None
+        if png and png.exists():
+            pixmap = QtGui.QPixmap(str(png))
+            if not pixmap.isNull():
+                return pixmap
+
+        reader = QtGui.QImageReader(id_)
+        if width and height:
+            reader.setScaledSize(QtCore.QSize(width, height))
+        image = reader.read()
+        if image.isNull():
+            return QtGui.QPixmap()
+
+        if png:
+            image.save(str(png), 'PNG')
+        return QtGui.QPixmap.fromImage(image)
+
+    def __str__(self) -> str:
+        return "<class 'IconProvider'>"
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import hashlib
+import os
+import pathlib
+import tempfile
+import time
+
+from ..tools import cache_path
+
+
+class QmlCache(object):
+    """Content-hashed QML file cache.
+
+    Stores each generated QML document in the user cache directory, with the
+    hash of its content as the file name. An identical document reuses the
+    same file, so the QML engine finds its compiled code in the disk cache
+    and the file is not written again.
+    """
+    def __init__(
+            self, path: pathlib.Path = None,
+            max_size: int = 16 * 1024 * 1024,
+            max_age: int = 30 * 24 * 60 * 60) -> None:
+        """
+        :param path: Cache directory. Default is the user cache directory.
+        :param max_size: Maximum size of all cached files, in bytes.
+        :param max_age: Maximum age of a cached file, in seconds.
+        """
+        self.__path = path if path else cache_path('qml', 'documents')
+        self.__max_size = max_size
+        self.__max_age = max_age
+
+    @property
+    def path(self) -> pathlib.Path:
+        """Cache directory."""
+        return self.__path
+
+    def file(self, qml_code: str) -> pathlib.Path:
+        """The cached file of a QML document.
+
+        The file is written only if no identical document is cached. The
+        access time of a cached file is updated, so `evict` removes the
+        least recently used. Its modification time is kept, the QML engine
+        compares it with the compiled code in its disk cache.
+
+        :param qml_code: QML document.
+        """
+        qml_code = qml_code.encode()
+        name = hashlib.sha256(qml_code).hexdigest()[:32]
+        qml_path = self.__path / f'{name}.qml'
+
+        if qml_path.exists():
+            try:
+                mtime = qml_path.stat().st_mtime_ns
+                os.utime(qml_path, ns=(time.time_ns(), mtime))
+            except OSError:
+                pass
+            return qml_path
+
+        # Atomic replace, so concurrent launches do not race
+        with tempfile.NamedTemporaryFile(
+                'wb', suffix='.tmp', dir=self.__path,
+                delete=False) as qml_file:
+            qml_file.write(qml_code)
+        os.replace(qml_file.name, qml_path)
+        return qml_path
+
+    def evict(self, keep: pathlib.Path = None) -> None:
+        """Remove old files.
+
+        Removes the files not used for `max_age`, then the least recently
+        used files until the cache size is less than `max_size`.
+
+        :param keep: A file that is never removed, like the one in use.
+        """
+        files = []
+        for qml_path in self.__path.glob('*.qml'):
+            try:
+                stat = qml_path.stat()
+            except OSError:
+                continue
+            # The access time is the last use
+            files.append((stat.st_atime, stat.st_size, qml_path))
+
+        now = time.time()
+        size = sum(file_size for _, file_size, _ in files)
+        for atime, file_size, qml_path in sorted(files):
+            if qml_path == keep:
+                continue
+            if now - atime < self.__max_age and size <= self.__max_size:
+                break
+
+            qml_path.unlink(missing_ok=True)
+            size -= file_size
+
+    def __str__(self) -> str:
+        return "<class 'QmlCache'>"
@@ -1,55 +1,54 @@
 #!/usr/bin/env python3
+import inspect
+import threading
+import weakref
+
 from PySide6 import QtCore
 
+from ..tools import RateLimit
+
 
-class BaseSignal(QtCore.QObject):
-    """Event Signals.
+class QueuedCall(QtCore.QObject):
+    """Calls functions in the thread of this object.
 
-    Signals are connections to events. When an event such as a mouse click 
-    or other event occurs, a signal is sent. The signal can be assigned a 
-    function to be executed when the signal is sent.
+    A Signal emitted in another thread delivers the call through this 
+    object, with a Qt queued connection. There is one object for each 
+    thread with connected functions, and the thread needs a Qt event loop, 
+    like the GUI thread. The object is kept in the thread local storage, so 
+    it is deleted when its thread finishes.
     """
-    __signal = QtCore.Signal()
+    __call = QtCore.Signal(object, tuple)
+    __local = threading.local()
 
-    def __init__(self, value: any = None, *args, **kwargs) -> None:
-        """
-        :param value: Object of any type. 
-            Use when you need to pass and retrieve a value.
-        """
+    def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self._obj = self.__signal
-
-        self.__value = value
+        self.__call.connect(self.__run, QtCore.Qt.QueuedConnection)
 
-    @property
-    def value(self) -> str:
-        """Value of any type passed to the class constructor."""
-        return self.__value
-
-    @value.setter
-    def value(self, value: str) -> None:
-        self.__value = value
+    @classmethod
+    def current(cls, create: bool = False) -> 'QueuedCall | None':
+        """The object of the current thread.
 
-    def callback(self, function, *args) -> None:
-        """Function to be executed.
-
-        :param function: Function to be executed when the signal is sent.
+        :param create: Creates the object if it does not exist.
         """
-        self.__signal.connect(function)
+        queued_call = getattr(cls.__local, 'queued_call', None)
+        if queued_call is None and create:
+            queued_call = cls.__local.queued_call = cls()
+        return queued_call
 
-    def remove_callback(self, function, *args) -> None:
-        """Function to be disconnected."""
-        self.__signal.disconnect(function)
+    def post(self, function: callable, args: tuple) -> None:
+        """Calls a function later, in the thread of this object.
 
-    def send(self) -> None:
-        """Send this signal.
-
-        This method should be executed when you need to send the signal.
+        :param function: Function to be executed.
+        :param args: Function arguments.
         """
-        self.__signal.emit()
+        self.__call.emit(function, args)
+
+    @staticmethod
+    def __run(function: callable, args: tuple) -> None:
+        function(*args)
 
     def __str__(self) -> str:
-        return "<class 'BaseSignal'>"
+        return "<class 'QueuedCall'>"
 
 
 class Signal(object):
@@ -68,14 +67,47 @@ class Signal(object):
         my_obj.obj_signal.connect(lamba: print('Signal has been emitted'))
 
     When a signal is emitted, it performs the connected function.
+
+    A signal with argument types passes the emitted values directly to the 
+    functions:
+
+        MyObj:
+            obj_signal = Signal(int, str)
+
+            def obj_call(self):
+                obj_signal.emit(1, 'text')
+
+
+        my_obj.obj_signal.connect(lambda num, text: print(num, text))
+
+    The functions are called directly when the signal is emitted in the 
+    thread that connected them, without a QObject. A signal emitted in 
+    another thread, like a worker thread, is delivered later in the thread 
+    of each function, through a Qt queued connection.
+
+    Methods are connected with a weak reference, so the signal does not keep 
+    their object alive. The method is disconnected when its object is 
+    collected, like a view that was discarded. Other functions, like 
+    lambdas, are kept until they are disconnected.
     """
-    def __init__(self):
-        self.__signal = BaseSignal()
+    def __init__(self, *types: type) -> None:
+        """
+        :param types: Argument types, like `int`, `str` or `object` for any 
+            Python value. Without types, the signal has no arguments.
+        """
+        self.__types = types
         self.__callback = None
+        self.__value = None
+        # (function or weak method, is weak, weak QueuedCall of the thread, 
+        # RateLimit or None) of each connection
+        self.__subscribers = []
 
     def callback(self) -> callable:
         """The callback sent."""
-        return self.__callback
+        if self.__callback is None:
+            return None
+        function, weak = self.__callback
+        return function() if weak else function
 
     @property
     def value(self) -> any:
@@ -85,27 +117,53 @@ class Signal(object):
             signal_value = my_signal.value
             self.my_signal.connect(lambda: print(signal_value))
         """
-        return self.__signal.value
+        return self.__value
 
     @value.setter
     def value(self, value: any) -> None:
-        self.__signal.value = value
+        self.__value = value
 
-    def connect(self, callback: callable = None) -> None:
+    def connect(
+            self, callback: callable = None, throttle_ms: int = 0,
+            debounce_ms: int = 0, coalesce: bool = False) -> None:
         """Function to be executed.
 
             my_obj.obj_signal.connect(self.my_function)
 
+        A burst of emits can be limited, the function then receives the 
+        latest values:
+
+            # At most one call every 100 ms
+            my_obj.obj_signal.connect(self.my_function, throttle_ms=100)
+
         :param callback: Function to be executed when the signal is sent.
+        :param throttle_ms: Call at once, then at most once per interval.
+        :param debounce_ms: Call when the signal was not emitted for this 
+            time.
+        :param coalesce: Call at most once per rendered frame.
         """
         if not callback:
-            if self.__callback:
-                self.__signal.callback(self.__callback)
-            else:
+            callback = self.callback()
+            if not callback:
                 print('Signal ERROR: Send callback')
+                return
+
+        if inspect.ismethod(callback):
+            function = weakref.WeakMethod(callback, self.__collected)
+            self.__callback = function, True
         else:
-            self.__callback = callback
-            self.__signal.callback(self.__callback)
+            function = callback
+            self.__callback = function, False
+
+        limit = None
+        if throttle_ms or debounce_ms or coalesce:
+            limit = RateLimit(
+                self.__weak_call(function) if self.__callback[1]
+                else function, throttle_ms, debounce_ms, coalesce)
+
+        thread = weakref.ref(QueuedCall.current(create=True))
+        self.__subscribers.append(
+            (function, self.__callback[1], thread, limit))
 
     def disconnect(self, callback: callable = None) -> None:
         """Function to be disconnected.
@@ -114,17 +172,65 @@ class Signal(object):
 
         :param callback: Function to be disconnect.
         """
-        if not callback:
-            self.__signal.remove_callback(self.__callback)
-        else:
-            self.__signal.remove_callback(callback)
-
-    def emit(self) -> None:
+        callback = callback if callback else self.callback()
+        for num, (function, weak, _, limit) in enumerate(
+                self.__subscribers):
+            if (function() if weak else function) == callback:
+                del self.__subscribers[num]
+                if limit:
+                    limit.cancel()
+                return
+
+    def emit(self, *args) -> None:
         """Send this signal.
 
         This method should be executed when you need to send the signal.
+
+        :param args: A value for each argument type of the signal.
         """
-        self.__signal.send()
+        if len(args) != len(self.__types):
+            raise TypeError(
+                f'Signal.emit: {len(self.__types)} arguments expected, '
+                f'{len(args)} given')
+
+        current = QueuedCall.current()
+        # A copy, so a function can connect and disconnect while emitting
+        for function, weak, thread, limit in tuple(self.__subscribers):
+            queued_call = thread()
+            if queued_call is None:
+                # The thread of the function has finished
+                continue
+            if limit:
+                function = limit
+            elif weak:
+                function = function()
+                if function is None:
+                    continue
+            if queued_call is current:
+                function(*args)
+            else:
+                queued_call.post(function, args)
+
+    def __collected(self, reference: weakref.WeakMethod) -> None:
+        # Disconnects a method whose object was collected
+        subscribers = []
+        for subscriber in self.__subscribers:
+            if subscriber[0] is not reference:
+                subscribers.append(subscriber)
+            elif subscriber[3]:
+                subscriber[3].cancel()
+        self.__subscribers = subscribers
+        if self.__callback and self.__callback[0] is reference:
+            self.__callback = None
+
+    @staticmethod
+    def __weak_call(reference: weakref.WeakMethod) -> callable:
+        # Calls a weak method, if its object was not collected
+        def call(*args) -> None:
+            method = reference()
+            if method is not None:
+                method(*args)
+        return call
 
     def __str__(self) -> str:
         return "<class 'Signal'>"
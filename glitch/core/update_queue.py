@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+import threading
+
+from PySide6 import QtCore, QtQuick
+
+
+class UpdateQueue(QtCore.QObject):
+    """Element changes from any thread, applied by the GUI thread.
+
+    Changing an element, like `label.text = 'value'`, is only safe in the
+    GUI thread. Other threads, like a worker reading a telemetry feed, put
+    the change in the queue:
+
+        UpdateQueue.shared().set(self.label, 'text', 'value')
+
+    The GUI thread applies the queued changes once per rendered frame of
+    the window. Only the last value of each element property is applied,
+    the previous values of the same frame are dropped.
+    """
+    __pending = QtCore.Signal()
+    __shared = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, window: QtQuick.QQuickWindow | None = None) -> None:
+        """
+        :param window: Window whose frames apply the changes. Without a
+            window, the changes are applied by the event loop.
+        """
+        super().__init__()
+        self.__lock = threading.Lock()
+        self.__updates = {}
+        self.__scheduled = False
+        self.__window = None
+        self.__pending.connect(self.__schedule, QtCore.Qt.QueuedConnection)
+        self.window = window
+
+    @classmethod
+    def shared(cls) -> 'UpdateQueue':
+        """The queue of the process, created on first use.
+
+        The Application sets its window, so the changes follow its frames.
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+                application = QtCore.QCoreApplication.instance()
+                if application:
+                    # Created by a worker thread, but runs in the GUI thread
+                    cls.__shared.moveToThread(application.thread())
+            return cls.__shared
+
+    @property
+    def window(self) -> QtQuick.QQuickWindow | None:
+        """Window whose frames apply the changes."""
+        return self.__window
+
+    @window.setter
+    def window(self, window: QtQuick.QQuickWindow | None) -> None:
+        if self.__window is not None:
+            self.__window.afterAnimating.disconnect(self.flush)
+        self.__window = window
+        if window is not None:
+            window.afterAnimating.connect(self.flush)
+
+    def set(self, element: object, name: str, value: any) -> None:
+        """Queues a change of an element property. Thread-safe.
+
+        :param element: Element or Layout, like a Label.
+        :param name: Python property name, like 'text' or 'size'.
+        :param value: New property value.
+        """
+        with self.__lock:
+            self.__updates[id(element), name] = element, name, value
+            if self.__scheduled:
+                return
+            self.__scheduled = True
+        self.__pending.emit()
+
+    @QtCore.Slot()
+    def flush(self) -> None:
+        """Applies the queued changes. Called by the GUI thread."""
+        if not self.__scheduled:
+            return
+
+        with self.__lock:
+            updates, self.__updates = self.__updates, {}
+            self.__scheduled = False
+        for element, name, value in updates.values():
+            setattr(element, name, value)
+
+    @QtCore.Slot()
+    def __schedule(self) -> None:
+        # In the GUI thread, after the first change of a frame
+        window = self.__window
+        if window is not None and window.isExposed():
+            # The changes are applied before the next frame
+            window.update()
+        else:
+            self.flush()
+
+    def __str__(self) -> str:
+        return "<class 'UpdateQueue'>"
@@ -2,3 +2,6 @@
 from .style import Style
 from .os_desk import OSDesk
 from .icons import Icons
+from .platform_profile import PlatformProfile
+from .icon_index import IconIndex
+from .icon_resolver import IconResolver
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+import json
+import logging
+import os
+import pathlib
+import threading
+
+import xdg.Config
+from xdg import IconTheme
+
+from ..tools import cache_path
+
+extensions = 'png', 'svg', 'xpm'
+# Format of the stored index, a different one is built again
+index_version = 2
+
+
+class IconIndex(object):
+    """Icon theme index, stored in the user cache directory.
+
+    Maps each icon name of a theme, of the themes it inherits and of the
+    'hicolor' theme, to its files and their sizes. A lookup is a single dict
+    access instead of a walk of the theme directories.
+
+    The lookup order is the one of the freedesktop icon theme specification,
+    so a path can differ from pyxdg for the same icon:
+
+        1. The first theme that has the icon: the theme, the themes it
+           inherits, then 'hicolor'. A better size in a later theme is not
+           used.
+        2. In that theme, a directory of the exact size, then a directory
+           whose scalable or threshold range has the size, then the
+           directory with the closest size.
+        3. Icons outside the themes, like '/usr/share/pixmaps'.
+
+    The stored index is valid while the modification times of the theme
+    directories are the same. A missing or stale index is built again in a
+    background thread, and `ready` is `False` until it is done.
+    """
+    def __init__(
+            self, theme: str | None = None,
+            path: pathlib.Path | None = None) -> None:
+        """
+        :param theme: Icon theme name, like 'breeze'. Uses the pyxdg default
+            theme if `None`.
+        :param path: Index file. Uses the user cache directory if `None`.
+        """
+        self.__theme = theme or xdg.Config.icon_theme
+        self.__path = path
+        self.__dirs = []
+        self.__icons = None
+        self.__lock = threading.Lock()
+        self.__thread = None
+
+    @property
+    def ready(self) -> bool:
+        """If the index is loaded and can be used."""
+        return self.__icons is not None
+
+    def load(self) -> bool:
+        """Loads the stored index.
+
+        Starts a background build if there is no valid index. Returns `True`
+        if the index is ready.
+        """
+        if self.ready:
+            return True
+
+        path = self.__file()
+        try:
+            with open(path, 'r') as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            data = None
+
+        if (data and data.get('version') == index_version
+                and data.get('theme') == self.__theme
+                and self.__is_valid(data.get('mtimes', {}))):
+            self.__dirs = data['dirs']
+            self.__icons = data['icons']
+            return True
+
+        self.rebuild()
+        return False
+
+    def lookup(self, name: str, size: int = 16) -> str | None:
+        """Path of the icon file closest to the size.
+
+        Returns `None` if no theme has the icon, or if the index is not
+        ready.
+
+        :param name: Icon name, like 'document-save'.
+        :param size: Icon size in pixels.
+        """
+        icons = self.__icons
+        if icons is None:
+            return None
+
+        entries = icons.get(name)
+        if not entries:
+            return None
+
+        # The entries are in theme directory order, and by extension in
+        # each directory. The first exact size wins, then the first range
+        # with the size, then the closest size.
+        dirs = self.__dirs
+        path, closest = None, None
+        for index, extension in entries:
+            directory, dir_size, min_size, max_size = dirs[index]
+            distance = (
+                0 if min_size is None else
+                min_size - size if size < min_size else
+                size - max_size if size > max_size else 0)
+            rank = distance, dir_size != size
+            if closest is None or rank < closest:
+                path = f'{directory}/{name}.{extension}'
+                closest = rank
+                if rank == (0, False):
+                    break
+        return path
+
+    def rebuild(self) -> None:
+        """Builds the index again in a background thread."""
+        with self.__lock:
+            if self.__thread and self.__thread.is_alive():
+                return
+            self.__thread = threading.Thread(
+                target=self.__rebuild, name='IconIndex', daemon=True)
+            self.__thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Waits for the background build. Returns `True` if it is ready.
+
+        :param timeout: Maximum time in seconds, or `None` to wait until the
+            build is done.
+        """
+        thread = self.__thread
+        if thread:
+            thread.join(timeout)
+        return self.ready
+
+    def __build(self) -> dict:
+        # Reads the theme directories
+        dirs, icons, mtimes = [], {}, {}
+        for base in IconTheme.icondirs:
+            if os.path.isdir(base):
+                mtimes[base] = os.path.getmtime(base)
+
+        for theme in self.__themes():
+            theme_names = set()
+            for subdir in theme.getDirectories():
+                size = theme.getSize(subdir) or 0
+                min_size, max_size = self.__sizes(theme, subdir)
+                for base in IconTheme.icondirs:
+                    directory = os.path.join(base, theme.name, subdir)
+                    if not subdir or not os.path.isdir(directory):
+                        continue
+                    mtimes[directory] = os.path.getmtime(directory)
+                    dirs.append((directory, size, min_size, max_size))
+                    self.__add_files(
+                        icons, theme_names, len(dirs) - 1, directory)
+
+        # Icons outside the themes, like '/usr/share/pixmaps', at any size
+        for base in IconTheme.icondirs:
+            if os.path.isdir(base):
+                dirs.append((base, None, None, None))
+                self.__add_files(icons, set(), len(dirs) - 1, base)
+
+        return {
+            'version': index_version, 'theme': self.__theme,
+            'mtimes': mtimes, 'dirs': dirs, 'icons': icons}
+
+    def __file(self) -> pathlib.Path:
+        # Index file of the theme
+        if self.__path:
+            return self.__path
+        return cache_path('icons') / f'{self.__theme}.json'
+
+    def __rebuild(self) -> None:
+        # Background thread
+        try:
+            data = self.__build()
+        except OSError as error:
+            logging.error(f'\n  IconIndex: {error}')
+            return
+
+        self.__dirs = data['dirs']
+        self.__icons = data['icons']
+        path = self.__file()
+        temp = path.with_suffix('.tmp')
+        try:
+            with open(temp, 'w') as index_file:
+                json.dump(data, index_file, separators=(',', ':'))
+            os.replace(temp, path)
+        except OSError as error:
+            logging.error(f'\n  IconIndex: {error}')
+
+    def __themes(self) -> list:
+        # The theme, the themes it inherits and 'hicolor', without repeats
+        themes, names, pending = [], set(), [self.__theme]
+        while pending:
+            name = pending.pop(0)
+            if name in names:
+                continue
+            names.add(name)
+            theme = self.__theme_file(name)
+            if theme:
+                themes.append(theme)
+                pending[0:0] = theme.getInherits()
+            if not pending and 'hicolor' not in names:
+                pending.append('hicolor')
+        return themes
+
+    @staticmethod
+    def __add_files(
+            icons: dict, theme_names: set, index: int,
+            directory: str) -> None:
+        # Icons of a directory. A name found in a previous theme is skipped.
+        found = {}
+        for file_name in os.listdir(directory):
+            name, _, extension = file_name.rpartition('.')
+            if extension not in extensions or not name:
+                continue
+            if name in icons and name not in theme_names:
+                continue
+            found.setdefault(name, []).append(extension)
+
+        for name, names_extensions in found.items():
+            theme_names.add(name)
+            entries = icons.setdefault(name, [])
+            for extension in extensions:
+                if extension in names_extensions:
+                    entries.append((index, extension))
+
+    @staticmethod
+    def __is_valid(mtimes: dict) -> bool:
+        # If no indexed directory changed
+        if not mtimes:
+            return False
+        for directory, mtime in mtimes.items():
+            try:
+                if os.path.getmtime(directory) != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    @staticmethod
+    def __sizes(theme: IconTheme.IconTheme, subdir: str) -> tuple:
+        # Minimum and maximum icon size of a theme directory
+        size = theme.getSize(subdir) or 0
+        type_ = theme.getType(subdir)
+        if type_ == 'Fixed':
+            return size, size
+        if type_ == 'Scalable':
+            return theme.getMinSize(subdir), theme.getMaxSize(subdir)
+        threshold = theme.getThreshold(subdir)
+        return size - threshold, size + threshold
+
+    @staticmethod
+    def __theme_file(name: str) -> IconTheme.IconTheme | None:
+        # Parsed 'index.theme' of a theme name
+        for base in IconTheme.icondirs:
+            for file_name in 'index.theme', 'index.desktop':
+                path = os.path.join(base, name, file_name)
+                if os.path.isfile(path):
+                    theme = IconTheme.IconTheme()
+                    theme.parse(path)
+                    return theme
+        return None
+
+    def __str__(self) -> str:
+        return "<class 'IconIndex'>"
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+import pathlib
+
+from xdg import IconTheme
+
+from .icon_index import IconIndex
+from .platform_profile import PlatformProfile
+
+
+class IconResolver(object):
+    """Icon name to file path.
+
+    Finds the icon in the platform icon theme, or in the icons of the
+    library. The result of each (name, size, theme, scale) is cached, also
+    when the icon is not found, so the theme directories are only walked
+    once per icon. The first lookups use the stored `IconIndex` of the 
+    theme, or pyxdg while the index is being built.
+
+    Use the `shared` resolver of the process, like the Buttons do:
+
+        path = IconResolver.shared().path('document-save')
+    """
+    __shared = None
+
+    def __init__(
+            self, profile: PlatformProfile,
+            fallback: pathlib.Path | None = None) -> None:
+        """
+        :param profile: Platform profile with the icon theme.
+        :param fallback: Directory of the SVG icons used when the theme does
+            not have the icon.
+        """
+        self.__profile = profile
+        self.__fallback = fallback
+        self.__index = None
+        self.__paths = {}
+
+    @classmethod
+    def shared(cls) -> 'IconResolver':
+        """The resolver of the process, created on first use."""
+        if cls.__shared is None:
+            fallback = pathlib.Path(
+                __file__).parent.parent / 'static' / 'icons' / 'linux'
+            cls.__shared = IconResolver(PlatformProfile.shared(), fallback)
+        return cls.__shared
+
+    @property
+    def theme(self) -> str | None:
+        """Icon theme name of the platform, like 'breeze-dark'."""
+        return self.__profile.icon_theme
+
+    def invalidate(self) -> None:
+        """Forgets the cached paths and the icon theme.
+
+        Used when the platform icon theme changes. The next lookups probe 
+        the theme again.
+        """
+        self.__profile.invalidate()
+        self.__index = None
+        self.__paths.clear()
+
+    def path(self, name: str, size: int = 16, scale: int = 1) -> str | None:
+        """Icon file path, or `None` if the icon was not found.
+
+        :param name: Icon name, like 'document-save'.
+        :param size: Icon size in logical pixels.
+        :param scale: Device pixel ratio, the icon is looked up at
+            `size * scale` pixels.
+        """
+        key = name, size, self.theme, scale
+        if key in self.__paths:
+            return self.__paths[key]
+
+        if self.__index is None:
+            self.__index = IconIndex(self.theme)
+            self.__index.load()
+
+        if self.__index.ready:
+            path = self.__index.lookup(name, size * scale)
+        else:
+            path = IconTheme.getIconPath(
+                iconname=name,
+                size=size * scale,
+                theme=self.theme,
+                extensions=['png', 'svg', 'xpm'])
+
+        if not path and self.__fallback:
+            fallback = self.__fallback / f'{name}.svg'
+            path = str(fallback) if fallback.exists() else None
+
+        self.__paths[key] = path
+        return path
+
+    def __str__(self) -> str:
+        return "<class 'IconResolver'>"
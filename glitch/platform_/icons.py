@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 import os
+import subprocess
 import sys
-from pathlib import Path
 
-from ..tools import IniParse
+from ..tools import IniParse, config_path
 
 
 class Icons(object):
@@ -18,7 +18,7 @@ class Icons(object):
             if self.__plasma_icon_theme:
                 return self.__plasma_icon_theme
 
-            kdeglobals = Path(os.environ['HOME']) / '.config' / 'kdeglobals'
+            kdeglobals = config_path('kdeglobals')
             if kdeglobals.exists():
                 ini = IniParse(kdeglobals)
 
@@ -35,22 +35,29 @@ class Icons(object):
             if self.__gtk_icon_theme:
                 return self.__gtk_icon_theme
 
-                gtk_icons = subprocess.getoutput(
-                    'dconf read /org/mate/desktop/interface/icon-theme').strip(
-                    "'")
-                self.__gtk_icon_theme = gtk_icons if gtk_icons else None
-                return self.__gtk_icon_theme
+            self.__gtk_icon_theme = self.__output(
+                ['dconf', 'read', '/org/mate/desktop/interface/icon-theme'])
+            return self.__gtk_icon_theme
 
         if self.__desktop_environment == 'gnome':
             if self.__gtk_icon_theme:
                 return self.__gtk_icon_theme
 
-            gtk_icons = subprocess.getoutput(
-                'gsettings get org.gnome.desktop.interface icon-theme').strip(
-                "'")
-            self.__gtk_icon_theme = gtk_icons if gtk_icons else None
+            self.__gtk_icon_theme = self.__output(
+                ['gsettings', 'get', 'org.gnome.desktop.interface',
+                 'icon-theme'])
             return self.__gtk_icon_theme
 
+    @staticmethod
+    def __output(command: list) -> str | None:
+        # Command output without quotes, or `None` if the command failed
+        try:
+            result = subprocess.run(command, capture_output=True, text=True)
+        except OSError:
+            return None
+        output = result.stdout.strip().strip("'")
+        return output if result.returncode == 0 and output else None
+
     def __str__(self) -> str:
         return "<class 'Icons'>"
 
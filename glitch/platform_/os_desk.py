@@ -36,24 +36,24 @@ class OSDesk(object):
     def __de(self) -> str:
         # ...
         if self.__operational_system == 'linux':
-            if (os.environ['DESKTOP_SESSION'] == 'plasma' or
-                    os.environ['XDG_SESSION_DESKTOP'] == 'KDE' or
-                    os.environ['XDG_CURRENT_DESKTOP'] == 'KDE'):
+            if (os.environ.get('DESKTOP_SESSION') == 'plasma' or
+                    os.environ.get('XDG_SESSION_DESKTOP') == 'KDE' or
+                    os.environ.get('XDG_CURRENT_DESKTOP') == 'KDE'):
                 return 'plasma'
 
-            if (os.environ['DESKTOP_SESSION'] == 'cinnamon' or
-                    os.environ['XDG_SESSION_DESKTOP'] == 'cinnamon' or
-                    os.environ['XDG_CURRENT_DESKTOP'] == 'X-Cinnamon'):
+            if (os.environ.get('DESKTOP_SESSION') == 'cinnamon' or
+                    os.environ.get('XDG_SESSION_DESKTOP') == 'cinnamon' or
+                    os.environ.get('XDG_CURRENT_DESKTOP') == 'X-Cinnamon'):
                 return 'cinnamon'
 
-            if (os.environ['DESKTOP_SESSION'] == 'xubuntu' or
-                    os.environ['XDG_SESSION_DESKTOP'] == 'xubuntu' or
-                    os.environ['XDG_CURRENT_DESKTOP'] == 'XFCE'):
+            if (os.environ.get('DESKTOP_SESSION') == 'xubuntu' or
+                    os.environ.get('XDG_SESSION_DESKTOP') == 'xubuntu' or
+                    os.environ.get('XDG_CURRENT_DESKTOP') == 'XFCE'):
                 return 'xfce'
 
-            if (os.environ['DESKTOP_SESSION'] == 'mate' or
-                    os.environ['XDG_SESSION_DESKTOP'] == 'mate' or
-                    os.environ['XDG_CURRENT_DESKTOP'] == 'MATE'):
+            if (os.environ.get('DESKTOP_SESSION') == 'mate' or
+                    os.environ.get('XDG_SESSION_DESKTOP') == 'mate' or
+                    os.environ.get('XDG_CURRENT_DESKTOP') == 'MATE'):
                 return 'mate'
 
             return 'gnome'
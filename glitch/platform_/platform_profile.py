@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+import json
+import os
+import pathlib
+
+from .icons import Icons
+from .os_desk import OSDesk
+from ..tools import cache_path, config_path
+
+# Environment variables that change the platform probe
+environment_vars = (
+    'DESKTOP_SESSION', 'XDG_SESSION_DESKTOP', 'XDG_CURRENT_DESKTOP', 'HOME',
+    'XDG_CONFIG_HOME')
+
+
+class PlatformProfile(object):
+    """Platform information of the process.
+
+    The operating system, desktop environment and icon theme are probed
+    once and shared by the Buttons and the icons. Reading the icon theme can
+    run `gsettings` or `dconf`, so a persistent profile is stored in the
+    user cache directory and reused while the environment variables and the
+    desktop settings files are the same.
+
+    Use the `shared` profile of the process:
+
+        desktop_environment = PlatformProfile.shared().desktop_environment
+    """
+    __shared = None
+
+    def __init__(self, persist: bool = False) -> None:
+        """
+        :param persist: Store the profile in the user cache directory and
+            reuse it on the next runs.
+        """
+        self.__persist = persist
+        self.__profile = None
+
+    @classmethod
+    def shared(cls) -> 'PlatformProfile':
+        """The persistent profile of the process, created on first use."""
+        if cls.__shared is None:
+            cls.__shared = PlatformProfile(persist=True)
+        return cls.__shared
+
+    @property
+    def desktop_environment(self) -> str:
+        """Desktop environment name, like 'plasma' or 'gnome'."""
+        return self.__get()['desktop_environment']
+
+    @property
+    def icon_theme(self) -> str | None:
+        """Icon theme name, like 'breeze-dark', or `None` if unknown."""
+        return self.__get()['icon_theme']
+
+    @property
+    def operational_system(self) -> str:
+        """Operational system name, like 'linux' or 'windows'."""
+        return self.__get()['operational_system']
+
+    def invalidate(self) -> None:
+        """Probes the platform again on the next access.
+
+        Used when a desktop setting changes, like the icon theme.
+        """
+        self.__profile = None
+        if self.__persist:
+            try:
+                self.__file().unlink()
+            except OSError:
+                pass
+
+    def __get(self) -> dict:
+        # Profile of this process, from the stored profile or a new probe
+        if self.__profile:
+            return self.__profile
+
+        key = self.__key()
+        if self.__persist:
+            try:
+                with open(self.__file(), 'r') as profile_file:
+                    profile = json.load(profile_file)
+            except (OSError, ValueError):
+                profile = None
+            if profile and profile.get('key') == key:
+                self.__profile = profile
+                return profile
+
+        os_desk = OSDesk()
+        desktop_environment = os_desk.desktop_environment
+        self.__profile = {
+            'key': key,
+            'operational_system': os_desk.operational_system,
+            'desktop_environment': desktop_environment,
+            'icon_theme': Icons(desktop_environment).icon_theme()}
+
+        if self.__persist:
+            try:
+                with open(self.__file(), 'w') as profile_file:
+                    json.dump(self.__profile, profile_file)
+            except OSError:
+                pass
+        return self.__profile
+
+    @staticmethod
+    def __file() -> pathlib.Path:
+        # Stored profile
+        return cache_path('platform') / 'profile.json'
+
+    @staticmethod
+    def __key() -> list:
+        # Environment variables and modification times of the desktop
+        # settings files. The stored profile is valid while they are equal.
+        mtimes = []
+        for path in config_path('kdeglobals'), config_path('dconf', 'user'):
+            try:
+                mtimes.append(path.stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return [os.environ.get(var) for var in environment_vars] + mtimes
+
+    def __str__(self) -> str:
+        return "<class 'PlatformProfile'>"
@@ -14,7 +14,10 @@ Button {
     property string baseClass: "Button"  // Base class name
     property color borderColor: "#555"
     property color backgroundColor: "#444"
-    property alias iconSource: icon.source
+    property string iconSource: ""
+    property int iconSize: 16
+    property alias iconItem: icon
+    property alias textItem: text
     property bool isHovered: false
     property bool hasIcon: iconSource !== ""
 
@@ -31,8 +34,11 @@ Button {
             Image {
                 id: icon
                 objectName: "icon"
-                source: ""
-                visible: icon.source !== ""
+                // Rasterized once by the IconProvider, for each size and DPR
+                source: button.iconSource === "" ? "" :
+                    "image://icons/" + encodeURI(button.iconSource)
+                sourceSize: Qt.size(button.iconSize, button.iconSize)
+                visible: icon.source != ""
                 fillMode: Image.PreserveAspectFit
                 anchors.verticalCenter: parent.verticalCenter
             }
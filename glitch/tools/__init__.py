@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
+from .cache import cache_path, config_path
 from .cli import output_by_args
 from .color_converter import *
 from .icon_collector import IconCollector
 from .ini_parse import IniParse
+from .rate_limit import RateLimit
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+import os
+import pathlib
+import platform
+
+
+def cache_path(*parts: str) -> pathlib.Path:
+    """Per-user cache directory.
+
+    cache_path('qml') -> "/home/user/.cache/glitch/qml"
+
+    The directory is created if it does not exist.
+
+    :param parts: Sub directory names like: 'qml', 'icons'
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or pathlib.Path.home()
+    elif platform.system() == 'Darwin':
+        base = pathlib.Path.home() / 'Library' / 'Caches'
+    else:
+        base = (os.environ.get('XDG_CACHE_HOME')
+            or pathlib.Path.home() / '.cache')
+
+    path = pathlib.Path(base, 'glitch', *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def config_path(*parts: str) -> pathlib.Path:
+    """Per-user config directory of the desktop.
+
+    config_path('kdeglobals') -> "/home/user/.config/kdeglobals"
+
+    :param parts: File or sub directory names like: 'kdeglobals'
+    """
+    base = os.environ.get('XDG_CONFIG_HOME') or pathlib.Path.home() / '.config'
+    return pathlib.Path(base, *parts)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+from PySide6 import QtCore, QtGui
+
+
+class RateLimit(object):
+    """Limits how often a function is called.
+
+    Wraps a function for a burst of events, like the mouse hover or wheel
+    events. Each call stores the latest arguments, and the function is
+    called with them:
+
+        # At most one call every 100 ms
+        RateLimit(self.on_hover, throttle_ms=100)
+
+        # One call, 300 ms after the last event
+        RateLimit(self.on_wheel, debounce_ms=300)
+
+        # At most one call per rendered frame
+        RateLimit(self.on_move, coalesce=True)
+
+    The calls are made by a QTimer, in the thread that created the
+    RateLimit.
+    """
+    def __init__(
+            self, function: callable, throttle_ms: int = 0,
+            debounce_ms: int = 0, coalesce: bool = False) -> None:
+        """
+        :param function: Function to be executed.
+        :param throttle_ms: Call at once, then at most once per interval
+            with the latest arguments.
+        :param debounce_ms: Call only when there were no calls for this
+            time. Has priority over `throttle_ms`.
+        :param coalesce: Call once per frame of the screen, about 16 ms, with
+            the latest arguments. Used if there is no other interval.
+        """
+        self.__function = function
+        if debounce_ms > 0:
+            self.__mode, self.__interval = 'debounce', debounce_ms
+        elif throttle_ms > 0:
+            self.__mode, self.__interval = 'throttle', throttle_ms
+        elif coalesce:
+            self.__mode, self.__interval = 'coalesce', self.__frame_ms()
+        else:
+            self.__mode, self.__interval = None, 0
+        self.__args = None
+        self.__timer = None
+
+    @property
+    def function(self) -> callable:
+        """The wrapped function."""
+        return self.__function
+
+    def cancel(self) -> None:
+        """Forgets the waiting call."""
+        self.__args = None
+        if self.__timer:
+            self.__timer.stop()
+
+    def __call__(self, *args) -> None:
+        if not self.__mode:
+            self.__function(*args)
+            return
+
+        if self.__timer is None:
+            self.__timer = QtCore.QTimer()
+            self.__timer.setSingleShot(True)
+            self.__timer.setInterval(self.__interval)
+            self.__timer.timeout.connect(self.__timeout)
+
+        if self.__mode == 'throttle':
+            if self.__timer.isActive():
+                self.__args = args
+            else:
+                # The first call of a burst is not delayed
+                self.__timer.start()
+                self.__function(*args)
+            return
+
+        # A debounce waits again after each call
+        self.__args = args
+        if self.__mode == 'debounce' or not self.__timer.isActive():
+            self.__timer.start()
+
+    def __timeout(self) -> None:
+        # Calls the function with the latest arguments
+        if self.__args is None:
+            return
+
+        args, self.__args = self.__args, None
+        if self.__mode == 'throttle':
+            # The next calls wait for a new interval
+            self.__timer.start()
+        self.__function(*args)
+
+    @staticmethod
+    def __frame_ms() -> int:
+        # Frame time of the primary screen
+        rate = 0
+        if isinstance(
+                QtCore.QCoreApplication.instance(), QtGui.QGuiApplication):
+            screen = QtGui.QGuiApplication.primaryScreen()
+            rate = screen.refreshRate() if screen else 0
+        return max(1, round(1000 / rate)) if rate > 0 else 16
+
+    def __str__(self) -> str:
+        return "<class 'RateLimit'>"
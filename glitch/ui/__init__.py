@@ -2,4 +2,4 @@
 from .base import Element, Frame, Layout
 from .element import Button, Label
 from .frame import MainFrame
-from .layout import Column, Panel, Row, Scroll
+from .layout import Column, ListScroll, Panel, Row, Scroll
@@ -13,15 +13,51 @@ class Element(UI):
     """
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        # QML
+        self._node.declare('baseClass', 'string', '"Element"')
+        self._node.set('height', 30)
+        self._node.set('width', 100)
+        self._node.declare('alignment', 'int', 'Qt.AlignHCenter')
+        self._node.set('Layout.alignment', 'alignment')
+        self._node.declare('fillWidth', 'bool', True)
+        self._node.declare('fillHeight', 'bool', False)
+        self._node.set('Layout.fillWidth', 'fillWidth')
+        self._node.set('Layout.fillHeight', 'fillHeight')
+        self._node.set('Layout.preferredWidth', 'width')
+        self._node.set('Layout.preferredHeight', 'height')
+        for margin in 'topMargin', 'rightMargin', 'bottomMargin', 'leftMargin':
+            self._node.declare(margin, 'int', 0)
+            self._node.set(f'Layout.{margin}', margin)
+
+        # Properties
         self.__fill_height = False
         self.__fill_width = True
         self.__height = 30
         self.__width = 100
         self.__size = self.__width, self.__height
         self.__margins = 0, 0, 0, 0
+        self.__style_targets = {}
 
         self.class_id('Element')
 
+    @property
+    def _style_targets(self) -> dict:
+        """Styled QML properties.
+
+        The properties changed by the style states, by target object. The
+        target is an object property of the element, or '' for the element
+        itself:
+
+            {'': ('color',), 'background': ('borderColor',)}
+
+        Without targets, the element style is only changed from Python.
+        """
+        return self.__style_targets
+
+    @_style_targets.setter
+    def _style_targets(self, targets: dict) -> None:
+        self.__style_targets = targets
+
     @property
     def margins(self) -> tuple:
         """Sets the `Button` margins.
@@ -76,14 +112,10 @@ class Element(UI):
             self._obj.setProperty('bottomMargin', bottom)
             self._obj.setProperty('leftMargin', left)
         else:
-            self._qml = self._qml.replace(
-                f'topMargin: {self.__margins[0]}', f'topMargin: {top}')
-            self._qml = self._qml.replace(
-                f'rightMargin: {self.__margins[1]}', f'rightMargin: {right}')
-            self._qml = self._qml.replace(
-                f'bottomMargin: {self.__margins[2]}',f'bottomMargin: {bottom}')
-            self._qml = self._qml.replace(
-                f'leftMargin: {self.__margins[3]}', f'leftMargin: {left}')
+            self._node.set('topMargin', top)
+            self._node.set('rightMargin', right)
+            self._node.set('bottomMargin', bottom)
+            self._node.set('leftMargin', left)
 
         self.__margins = top, left, bottom, right
 
@@ -167,19 +199,16 @@ class Element(UI):
     def __set_qml_size(
             self, enum: Size, width_height: 'width', value: int) -> None:
         fill = 'fillWidth' if width_height == 'width' else 'fillHeight'
-        old_value = self.__width if width_height == 'width' else self.__height
 
         if enum:
             if enum == Size.FILL:
-                self._qml = self._qml.replace(f'{fill}: false',f'{fill}: true')
+                self._node.set(fill, True)
 
-            elif f'property bool {fill}: false' in self._qml:
-                self._qml = self._qml.replace(
-                    f'{width_height}: {old_value}', f'{width_height}: {value}')
+            elif self._node.get(fill) == 'false':
+                self._node.set(width_height, value)
         else:
-            self._qml = self._qml.replace(
-                f'{fill}: true', f'{fill}: false').replace(
-                    f'{width_height}: {old_value}', f'{width_height}: {value}')
+            self._node.set(fill, False)
+            self._node.set(width_height, value)
 
     def __str__(self) -> str:
         return "<class 'Element'>"
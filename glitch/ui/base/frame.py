@@ -1,248 +1,239 @@
 #!/usr/bin/env python3
 import logging
+import pathlib
 
 from PySide6 import QtCore
 
+from .qml_node import QmlNode
 from .ui import UI
 from ...enum import Event, FrameHint, FrameShape, Orientation
 from ...platform_ import Style
-
-
-header = """
-import QtQuick
-import QtQuick.Controls
-import QtQuick.Layouts
-import QtQuick.Shapes
-
-import "elements"
-
-
-Window {
-    id: frame  // ID
-    objectName: "frame"  // Object name
-    property string qmlType: "Window"  // Class Name
-    property string baseClass: "Frame"  // Base class name
+from ...tools import RateLimit
+
+
+imports = [
+    'import QtQuick',
+    'import QtQuick.Controls',
+    'import QtQuick.Layouts',
+    'import QtQuick.Shapes',
+    '',
+    # Absolute, so the QML can be loaded from memory or from any directory
+    'import "{}"'.format((pathlib.Path(__file__).parent.parent.parent
+        / 'static' / 'qml' / 'elements').as_uri()),
+    '',
+    ]
+
+mouse_area = """
+MouseArea {
+    anchors.fill: parent
+    acceptedButtons: Qt.RightButton
+    onPressed: logic.connections()
+}
 """
 
-properties = """
-    title: qsTr("Cell")
-    color: "transparent"
-    flags: Qt.FramelessWindowHint
+canvas = """
+Canvas {
+    id: canvas
+    objectName: "canvas"
+    anchors.fill: parent
+    property int borderSpacing: 1
+
+    onPaint: {
+        var ctx = getContext("2d");
+        ctx.clearRect(0, 0, width, height);
+
+        // Função para desenhar retângulo arredondado com raios individuais
+        function roundedRect(x, y, w, h, rtl, rtr, rbr, rbl) {
+            ctx.beginPath();
+            ctx.moveTo(x + rtl, y);
+            ctx.lineTo(x + w - rtr, y);
+            ctx.arcTo(x + w, y, x + w, y + rtr, rtr);
+            ctx.lineTo(x + w, y + h - rbr);
+            ctx.arcTo(x + w, y + h, x + w - rbr, y + h, rbr);
+            ctx.lineTo(x + rbl, y + h);
+            ctx.arcTo(x, y + h, x, y + h - rbl, rbl);
+            ctx.lineTo(x, y + rtl);
+            ctx.arcTo(x, y, x + rtl, y, rtl);
+            ctx.closePath();
+        }
 
-    property int width_: 300
-    property int height_: 300
-    width: width_
-    height: height_
+        // --- Background ---
+        roundedRect(1, 1, width - 2, height - 2,
+                    mainRect.radiusTopLeft, mainRect.radiusTopRight,
+                    mainRect.radiusBottomRight, mainRect.radiusBottomLeft);
+        ctx.fillStyle = mainRect.backgroundColor;
+        ctx.fill();
+
+        // --- Outer border ---
+        roundedRect(0, 0, width, height,
+                    mainRect.radiusTopLeft + 2, mainRect.radiusTopRight + 2,
+                    mainRect.radiusBottomRight + 2, mainRect.radiusBottomLeft + 2);
+        ctx.strokeStyle = mainRect.outLineColor;
+        ctx.lineWidth = mainRect.outLineWidth;
+        ctx.stroke();
+
+        // --- Inner border ---
+        var inset = borderSpacing + mainRect.borderWidth / 2;
+        roundedRect(
+            inset, inset,
+            width - inset * 2,
+            height - inset * 2,
+            Math.max(0, mainRect.radiusTopLeft - inset),
+            Math.max(0, mainRect.radiusTopRight - inset),
+            Math.max(0, mainRect.radiusBottomRight - inset),
+            Math.max(0, mainRect.radiusBottomLeft - inset)
+        );
+        ctx.strokeStyle = mainRect.borderColor;
+        ctx.lineWidth = mainRect.borderWidth;
+        ctx.stroke();
+    }
+}
+"""
 
-    minimumWidth: 100
-    minimumHeight: 100
+rectangles = """
+Item {
+    id: sceneBackground
+    objectName: "sceneBackground"
+    anchors.fill: parent
+    property int borderSpacing: 1
 
-    visible: true
-    visibility: Window.Windowed
+    // Outer border
+    Rectangle {
+        anchors.fill: parent
+        color: "transparent"
+        border.color: mainRect.outLineColor
+        border.width: mainRect.outLineWidth
+        topLeftRadius: mainRect.radiusTopLeft + 2
+        topRightRadius: mainRect.radiusTopRight + 2
+        bottomRightRadius: mainRect.radiusBottomRight + 2
+        bottomLeftRadius: mainRect.radiusBottomLeft + 2
+        antialiasing: true
+    }
 
-    MouseArea {
+    // Background
+    Rectangle {
         anchors.fill: parent
-        acceptedButtons: Qt.RightButton
-        onPressed: logic.connections()
+        anchors.margins: 1
+        color: mainRect.backgroundColor
+        topLeftRadius: mainRect.radiusTopLeft
+        topRightRadius: mainRect.radiusTopRight
+        bottomRightRadius: mainRect.radiusBottomRight
+        bottomLeftRadius: mainRect.radiusBottomLeft
+        antialiasing: true
     }
 
+    // Inner border
     Rectangle {
-        id: mainRect
-        objectName: "mainRect"
         anchors.fill: parent
+        anchors.margins: sceneBackground.borderSpacing
         color: "transparent"
-        z: 1
-        property bool isActive: true
-
-        property color backgroundColor: "#222"
-        property color borderColor: "#333"
-        property color outLineColor: "#44000000"
-        property int borderWidth: 1
-        property int outLineWidth: 1
-
-        property int radiusTopLeft: 10
-        property int radiusTopRight: 10
-        property int radiusBottomRight: 10
-        property int radiusBottomLeft: 10
-
-        Canvas {
-            id: canvas
-            objectName: "canvas"
-            anchors.fill: parent
-            property int borderSpacing: 1
-
-            onPaint: {
-                var ctx = getContext("2d");
-                ctx.clearRect(0, 0, width, height);
-
-                // Função para desenhar retângulo arredondado com raios individuais
-                function roundedRect(x, y, w, h, rtl, rtr, rbr, rbl) {
-                    ctx.beginPath();
-                    ctx.moveTo(x + rtl, y);
-                    ctx.lineTo(x + w - rtr, y);
-                    ctx.arcTo(x + w, y, x + w, y + rtr, rtr);
-                    ctx.lineTo(x + w, y + h - rbr);
-                    ctx.arcTo(x + w, y + h, x + w - rbr, y + h, rbr);
-                    ctx.lineTo(x + rbl, y + h);
-                    ctx.arcTo(x, y + h, x, y + h - rbl, rbl);
-                    ctx.lineTo(x, y + rtl);
-                    ctx.arcTo(x, y, x + rtl, y, rtl);
-                    ctx.closePath();
-                }
-
-                // --- Background ---
-                roundedRect(1, 1, width - 2, height - 2,
-                            mainRect.radiusTopLeft, mainRect.radiusTopRight,
-                            mainRect.radiusBottomRight, mainRect.radiusBottomLeft);
-                ctx.fillStyle = mainRect.backgroundColor;
-                ctx.fill();
-
-                // --- Outer border ---
-                roundedRect(0, 0, width, height,
-                            mainRect.radiusTopLeft + 2, mainRect.radiusTopRight + 2,
-                            mainRect.radiusBottomRight + 2, mainRect.radiusBottomLeft + 2);
-                ctx.strokeStyle = mainRect.outLineColor;
-                ctx.lineWidth = mainRect.outLineWidth;
-                ctx.stroke();
-
-                // --- Inner border ---
-                var inset = borderSpacing + mainRect.borderWidth / 2;
-                roundedRect(
-                    inset, inset,
-                    width - inset * 2,
-                    height - inset * 2,
-                    Math.max(0, mainRect.radiusTopLeft - inset),
-                    Math.max(0, mainRect.radiusTopRight - inset),
-                    Math.max(0, mainRect.radiusBottomRight - inset),
-                    Math.max(0, mainRect.radiusBottomLeft - inset)
-                );
-                ctx.strokeStyle = mainRect.borderColor;
-                ctx.lineWidth = mainRect.borderWidth;
-                ctx.stroke();
-            }
-        }
-
-// MainFrame
-
-// Resize corners
-
-        ColumnLayout {
-            id: mainColumnLayout
-            objectName: "mainColumnLayout"
-            anchors.fill: parent
-            // anchors.top: parent.top
-            anchors.margins: 6
-            spacing: 6
-            clip: true
-            // Layout.fillHeight: false
-            Layout.alignment: Qt.AlignTop
-            Layout.fillWidth: true
-
-// Close
-
-        }
+        border.color: mainRect.borderColor
+        border.width: mainRect.borderWidth
+        topLeftRadius: Math.max(0, mainRect.radiusTopLeft - 1)
+        topRightRadius: Math.max(0, mainRect.radiusTopRight - 1)
+        bottomRightRadius: Math.max(0, mainRect.radiusBottomRight - 1)
+        bottomLeftRadius: Math.max(0, mainRect.radiusBottomLeft - 1)
+        antialiasing: true
     }
+}
 """
-# } close on UI
 
 edges = """
-// Resize corners
 // Top left - resize NW
-        MouseArea {
-            id: resizeTopLeft
-            width: 10
-            height: 10
-            anchors.top: parent.top
-            anchors.left: parent.left
-            cursorShape: Qt.SizeFDiagCursor
-            hoverEnabled: true
-            onPressed: logic.start_resize(Qt.TopEdge | Qt.LeftEdge)
-        }
-
-        // Top right - resize NE
-        MouseArea {
-            id: resizeTopRight
-            width: 10
-            height: 10
-            anchors.top: parent.top
-            anchors.right: parent.right
-            cursorShape: Qt.SizeBDiagCursor
-            hoverEnabled: true
-            onPressed: logic.start_resize(Qt.TopEdge | Qt.RightEdge)
-        }
-
-        // Bottom left - resize SW
-        MouseArea {
-            id: resizeBottomLeft
-            width: 10
-            height: 10
-            anchors.bottom: parent.bottom
-            anchors.left: parent.left
-            cursorShape: Qt.SizeBDiagCursor
-            hoverEnabled: true
-            onPressed: logic.start_resize(Qt.BottomEdge | Qt.LeftEdge)
-        }
-
-        // Bottom right - resize SE
-        MouseArea {
-            id: resizeBottomRight
-            width: 10
-            height: 10
-            anchors.bottom: parent.bottom
-            anchors.right: parent.right
-            cursorShape: Qt.SizeFDiagCursor
-            hoverEnabled: true
-            onPressed: logic.start_resize(Qt.BottomEdge | Qt.RightEdge)
-        }
-
-        // Top - N
-        MouseArea {
-            id: resizeTop
-            anchors.top: parent.top
-            anchors.left: resizeTopLeft.right
-            anchors.right: resizeTopRight.left
-            height: 5
-            cursorShape: Qt.SizeVerCursor
-            hoverEnabled: true
-            onPressed: logic.start_resize(Qt.TopEdge)
-        }
-
-        // Bottom - S
-        MouseArea {
-            id: resizeBottom
-            anchors.bottom: parent.bottom
-            anchors.left: resizeBottomLeft.right
-            anchors.right: resizeBottomRight.left
-            height: 5
-            cursorShape: Qt.SizeVerCursor
-            hoverEnabled: true
-            onPressed: logic.start_resize(Qt.BottomEdge)
-        }
-
-        // Left - W
-        MouseArea {
-            id: resizeLeft
-            anchors.top: resizeTopLeft.bottom
-            anchors.bottom: resizeBottomLeft.top
-            anchors.left: parent.left
-            width: 5
-            cursorShape: Qt.SizeHorCursor
-            hoverEnabled: true
-            onPressed: logic.start_resize(Qt.LeftEdge)
-        }
-
-        // Right - E
-        MouseArea {
-            id: resizeRight
-            anchors.top: resizeTopRight.bottom
-            anchors.bottom: resizeBottomRight.top
-            anchors.right: parent.right
-            width: 5
-            cursorShape: Qt.SizeHorCursor
-            hoverEnabled: true
-            onPressed: logic.start_resize(Qt.RightEdge)
-        }
-// Resize corners
+MouseArea {
+    id: resizeTopLeft
+    width: 10
+    height: 10
+    anchors.top: parent.top
+    anchors.left: parent.left
+    cursorShape: Qt.SizeFDiagCursor
+    hoverEnabled: true
+    onPressed: logic.start_resize(Qt.TopEdge | Qt.LeftEdge)
+}
+
+// Top right - resize NE
+MouseArea {
+    id: resizeTopRight
+    width: 10
+    height: 10
+    anchors.top: parent.top
+    anchors.right: parent.right
+    cursorShape: Qt.SizeBDiagCursor
+    hoverEnabled: true
+    onPressed: logic.start_resize(Qt.TopEdge | Qt.RightEdge)
+}
+
+// Bottom left - resize SW
+MouseArea {
+    id: resizeBottomLeft
+    width: 10
+    height: 10
+    anchors.bottom: parent.bottom
+    anchors.left: parent.left
+    cursorShape: Qt.SizeBDiagCursor
+    hoverEnabled: true
+    onPressed: logic.start_resize(Qt.BottomEdge | Qt.LeftEdge)
+}
+
+// Bottom right - resize SE
+MouseArea {
+    id: resizeBottomRight
+    width: 10
+    height: 10
+    anchors.bottom: parent.bottom
+    anchors.right: parent.right
+    cursorShape: Qt.SizeFDiagCursor
+    hoverEnabled: true
+    onPressed: logic.start_resize(Qt.BottomEdge | Qt.RightEdge)
+}
+
+// Top - N
+MouseArea {
+    id: resizeTop
+    anchors.top: parent.top
+    anchors.left: resizeTopLeft.right
+    anchors.right: resizeTopRight.left
+    height: 5
+    cursorShape: Qt.SizeVerCursor
+    hoverEnabled: true
+    onPressed: logic.start_resize(Qt.TopEdge)
+}
+
+// Bottom - S
+MouseArea {
+    id: resizeBottom
+    anchors.bottom: parent.bottom
+    anchors.left: resizeBottomLeft.right
+    anchors.right: resizeBottomRight.left
+    height: 5
+    cursorShape: Qt.SizeVerCursor
+    hoverEnabled: true
+    onPressed: logic.start_resize(Qt.BottomEdge)
+}
+
+// Left - W
+MouseArea {
+    id: resizeLeft
+    anchors.top: resizeTopLeft.bottom
+    anchors.bottom: resizeBottomLeft.top
+    anchors.left: parent.left
+    width: 5
+    cursorShape: Qt.SizeHorCursor
+    hoverEnabled: true
+    onPressed: logic.start_resize(Qt.LeftEdge)
+}
+
+// Right - E
+MouseArea {
+    id: resizeRight
+    anchors.top: resizeTopRight.bottom
+    anchors.bottom: resizeBottomRight.top
+    anchors.right: parent.right
+    width: 5
+    cursorShape: Qt.SizeHorCursor
+    hoverEnabled: true
+    onPressed: logic.start_resize(Qt.RightEdge)
+}
 """
 
 
@@ -279,11 +270,48 @@ class Frame(UI):
         self.__resizable = resizable
 
         # QML
-        self._qml = header + self._qml.split('// Frame header')[1]
-        self._qml = self._qml.replace('\n    // Property', properties)
+        self._node = QmlNode('Window')
+        self._node.imports = list(imports)
+        self._node.declare('baseClass', 'string', '"Frame"')
+        self._node.set('title', 'qsTr("Cell")')
+        self._node.set('color', '"transparent"')
+        self._node.set('flags', 'Qt.FramelessWindowHint')
+        self._node.declare('width_', 'int', 300)
+        self._node.declare('height_', 'int', 300)
+        self._node.set('width', 'width_')
+        self._node.set('height', 'height_')
+        self._node.set('minimumWidth', 100)
+        self._node.set('minimumHeight', 100)
+        self._node.set('visible', True)
+        self._node.set('visibility', 'Window.Windowed')
+        self._node.append(mouse_area)
+
+        main_rect = self._node.append(QmlNode('Rectangle', 'mainRect'))
+        main_rect.set('anchors.fill', 'parent')
+        main_rect.set('color', '"transparent"')
+        main_rect.set('z', 1)
+        main_rect.declare('isActive', 'bool', True)
+        main_rect.declare('backgroundColor', 'color', '"#222"')
+        main_rect.declare('borderColor', 'color', '"#333"')
+        main_rect.declare('outLineColor', 'color', '"#44000000"')
+        main_rect.declare('borderWidth', 'int', 1)
+        main_rect.declare('outLineWidth', 'int', 1)
+        main_rect.declare('radiusTopLeft', 'int', 10)
+        main_rect.declare('radiusTopRight', 'int', 10)
+        main_rect.declare('radiusBottomRight', 'int', 10)
+        main_rect.declare('radiusBottomLeft', 'int', 10)
+        main_rect.append(canvas)
         if self.__resizable:
-            qml_init, qml_end = self._qml.split('\n// Resize corners')
-            self._qml = qml_init + edges + qml_end
+            main_rect.append(edges)
+
+        column = main_rect.append(QmlNode('ColumnLayout', 'mainColumnLayout'))
+        column.set('anchors.fill', 'parent')
+        column.set('anchors.margins', 6)
+        column.set('spacing', 6)
+        column.set('clip', True)
+        column.set('Layout.alignment', 'Qt.AlignTop')
+        column.set('Layout.fillWidth', True)
+        self._node.content = column
         self.class_id('Frame')
 
         # Properties
@@ -299,6 +327,40 @@ class Frame(UI):
         self.__visibility = 'Window.Windowed'
         self.__callbacks = {}
         self.__radius = 10, 10, 10, 10
+        self.__objects = {}
+        self.__scene_graph = False
+
+    @property
+    def _objects(self) -> dict:
+        """Qt Objects.
+
+        Internal index of the QML objects by objectName, set when the window 
+        is rendered.
+        """
+        return self.__objects
+
+    @_objects.setter
+    def _objects(self, objects: dict) -> None:
+        self.__objects = objects
+
+    @property
+    def _scene_graph(self) -> bool:
+        """Scene graph background.
+
+        If `True`, the background and borders are Rectangles with radius per 
+        corner, instead of a Canvas painted with JavaScript. A color or state 
+        change only updates the Rectangles, without repainting the window. 
+        Requires Qt 6.7 or later. Set before the window is rendered.
+        """
+        return self.__scene_graph
+
+    @_scene_graph.setter
+    def _scene_graph(self, scene_graph: bool) -> None:
+        main_rect = self._node.find('mainRect')
+        old, new = (canvas, rectangles) if scene_graph else (rectangles, canvas)
+        if old in main_rect.children:
+            main_rect.children[main_rect.children.index(old)] = new
+        self.__scene_graph = scene_graph
 
     @property
     def hint(self) -> FrameHint:
@@ -336,9 +398,7 @@ class Frame(UI):
         if self._obj:
             self._obj.setProperty('flags', int(hint.value))
         else:
-            self._qml = self._qml.replace(
-                f'flags: {hints[self.__hint.name]}',
-                f'flags: {hints[hint.name]}')
+            self._node.set('flags', hints[hint.name])
 
         self.__hint = hint
 
@@ -406,7 +466,7 @@ class Frame(UI):
             self._obj.setProperty('radiusBottomLeft', bottom_l)
 
             # TODO: Move to Application().processEvents()  works the right way
-            self._obj.findChild(QtCore.QObject, 'canvas').requestPaint()
+            self._objects['canvas'].requestPaint()
             shape = self.shape
             self.shape = (FrameShape.MAXIMIZED
                 if shape.name != 'MAXIMIZED' else FrameShape.FULL_SCREEN)
@@ -415,18 +475,11 @@ class Frame(UI):
             QtCore.QTimer.singleShot(300, lambda: _shape_(shape))
             
         else:
-            self._qml = self._qml.replace(
-                f'property int radiusTopLeft: {self.__radius[0]}',
-                f'property int radiusTopLeft: {top_l}')
-            self._qml = self._qml.replace(
-                f'property int radiusTopRight: {self.__radius[1]}',
-                f'property int radiusTopRight: {top_r}')
-            self._qml = self._qml.replace(
-                f'property int radiusBottomRight: {self.__radius[2]}',
-                f'property int radiusBottomRight: {bottom_r}')
-            self._qml = self._qml.replace(
-                f'property int radiusBottomLeft: {self.__radius[3]}',
-                f'property int radiusBottomLeft: {bottom_l}')
+            main_rect = self._node.find('mainRect')
+            main_rect.set('radiusTopLeft', top_l)
+            main_rect.set('radiusTopRight', top_r)
+            main_rect.set('radiusBottomRight', bottom_r)
+            main_rect.set('radiusBottomLeft', bottom_l)
 
         self.__radius = top_l, top_r, bottom_r, bottom_l
 
@@ -458,9 +511,7 @@ class Frame(UI):
             elif shape.value == 5:
                 self._obj.showFullScreen()
         else:
-            self._qml = self._qml.replace(
-                f'visibility: {self.__visibility}',
-                f'visibility: {visibility}')
+            self._node.set('visibility', visibility)
 
         self.__visibility = visibility
         self.__shape = shape
@@ -495,9 +546,8 @@ class Frame(UI):
             self._obj.setProperty('width_', width)
             self._obj.setProperty('height_', height)
         else:
-            self._qml = self._qml.replace(
-                f'width_: {self.__width}', f'width_: {width}').replace(
-                f'height_: {self.__height}', f'height_: {height}')
+            self._node.set('width_', width)
+            self._node.set('height_', height)
 
         self.__width = width
         self.__height = height
@@ -515,12 +565,9 @@ class Frame(UI):
     @spacing.setter
     def spacing(self, spacing: int) -> None:
         if self._obj:
-            self._obj.findChild(
-                QtCore.QObject, 'mainColumnLayout').setProperty(
-                    'spacing', spacing)
+            self._objects['mainColumnLayout'].setProperty('spacing', spacing)
         else:
-            self._qml = self._qml.replace(
-                f'spacing: {self.__spacing}', f'spacing: {spacing}')
+            self._node.content.set('spacing', spacing)
 
         self.__spacing = spacing
 
@@ -545,14 +592,34 @@ class Frame(UI):
         :param obj: Element or Layout object type
         """
         if self._obj:
-            obj._obj.setParentItem(self)
-            # obj._obj.setParentItem(self._obj)
+            # After render, the QML object is created
+            self._handler.insert(self, [obj])
         else:
-            setattr(self, obj._id, obj)
+            self._node.content.append(obj._node)
 
+        obj._parent = self
         self.__items.append(obj)
         return obj
 
+    def add_items(self, items: list) -> list:
+        """Add a list of items.
+
+        Like `add`, but after the window is rendered, all the items are 
+        created before the Layout arranges them once.
+
+        :param items: Element or Layout objects.
+        """
+        if self._obj:
+            self._handler.insert(self, items)
+        else:
+            for obj in items:
+                self._node.content.append(obj._node)
+
+        for obj in items:
+            obj._parent = self
+        self.__items.extend(items)
+        return items
+
     def callbacks(self) -> dict:
         """The functions used in the `connect` method.
 
@@ -562,7 +629,9 @@ class Frame(UI):
         return self.__callbacks
 
     def connect(
-            self, method: callable, event: Event = Event.MOUSE_PRESS) -> None:
+            self, method: callable, event: Event = Event.MOUSE_PRESS,
+            throttle_ms: int = 0, debounce_ms: int = 0,
+            coalesce: bool = False) -> None:
         """Connect the button to a method.
 
         Pass a method to be executed when interacting with the button.
@@ -571,7 +640,12 @@ class Frame(UI):
 
         :param method: method to be executed when interacting with the button.
         :param event: Enum like `Event.MOUSE_HOVER` or `Event.MOUSE_WHEEL`
+        :param throttle_ms: Call at once, then at most once per interval.
+        :param debounce_ms: Call when there were no events for this time.
+        :param coalesce: Call at most once per rendered frame.
         """
+        if throttle_ms or debounce_ms or coalesce:
+            method = RateLimit(method, throttle_ms, debounce_ms, coalesce)
         self.__callbacks[event] = method
 
     def items(self) -> list:
@@ -581,5 +655,21 @@ class Frame(UI):
         """
         return self.__items
 
+    def remove(self, obj: Layout | Element) -> None:
+        """Remove an item.
+
+        Removes an Element or Layout added to this Layout. After the window 
+        is rendered, its QML object is destroyed.
+
+        :param obj: Element or Layout object type
+        """
+        if self._obj:
+            self._handler.remove([obj])
+        else:
+            self._node.content.children.remove(obj._node)
+
+        obj._parent = None
+        self.__items.remove(obj)
+
     def __str__(self) -> str:
         return "<class 'Frame'>"
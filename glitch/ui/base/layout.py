@@ -3,35 +3,11 @@ import logging
 
 from PySide6 import QtCore
 
+from .qml_node import QmlNode
 from .ui import UI
 from ...enum import Orientation
 
 
-column = """
-ColumnLayout {
-    id: column  // ID
-    objectName: "column"  // Object name
-    property string qmlType: "Column"  // Class Name
-    property string baseClass: "Layout"  // Base class name
-"""
-
-row = """
-RowLayout {
-    id: row  // ID
-    objectName: "row"  // Object name
-    property string qmlType: "Row"  // Class Name
-    property string baseClass: "Layout"  // Base class name
-"""
-
-properties = """
-    // Layout header
-    spacing: 6
-
-// Close
-"""
-# } close on UI
-
-
 class Layout(object):
     """Layout object.
 
@@ -65,9 +41,14 @@ class Layout(UI):
         """
         super().__init__(*args, **kwargs)
         # QML
-        header = column if orientation == Orientation.VERTICAL else row
-        self._qml = header + self._qml.split('// Layout header')[1]
-        self._qml = self._qml.replace('\n    // Property', properties)
+        self._node = QmlNode(
+            'ColumnLayout' if orientation == Orientation.VERTICAL
+            else 'RowLayout')
+        self._node.declare('baseClass', 'string', '"Layout"')
+        for margin in 'topMargin', 'rightMargin', 'bottomMargin', 'leftMargin':
+            self._node.declare(margin, 'int', 0)
+            self._node.set(f'Layout.{margin}', margin)
+        self._node.set('spacing', 6)
         self.class_id('Layout')
 
         # Properties
@@ -134,18 +115,13 @@ class Layout(UI):
             self._obj.setProperty('bottomMargin', bottom)
             self._obj.setProperty('leftMargin', left)
         else:
-            self._qml = self._qml.replace(
-                f'property int topMargin: {self.__margins[0]}',
-                f'property int topMargin: {top}')
-            self._qml = self._qml.replace(
-                f'property int rightMargin: {self.__margins[1]}',
-                f'property int rightMargin: {right}')
-            self._qml = self._qml.replace(
-                f'property int bottomMargin: {self.__margins[2]}',
-                f'property int bottomMargin: {bottom}')
-            self._qml = self._qml.replace(
-                f'property int leftMargin: {self.__margins[3]}',
-                f'property int leftMargin: {left}')
+            # Layouts like Panel keep the margins in the content node
+            node = (self._node if 'topMargin' in self._node.declarations
+                else self._node.content)
+            node.set('topMargin', top)
+            node.set('rightMargin', right)
+            node.set('bottomMargin', bottom)
+            node.set('leftMargin', left)
 
         self.__margins = top, left, bottom, right
 
@@ -159,8 +135,7 @@ class Layout(UI):
         if self._obj:
             self._obj.setProperty('spacing', spacing)
         else:
-            self._qml = self._qml.replace(
-                f'spacing: {self.__spacing}', f'spacing: {spacing}')
+            self._node.content.set('spacing', spacing)
 
         self.__spacing = spacing
 
@@ -171,14 +146,42 @@ class Layout(UI):
         
         :param obj: Element or Layout object type
         """
+        ancestor = self.__rendered_ancestor()
         if self._obj:
-            obj._obj.setParentItem(self)
+            # After render, the QML object is created
+            self._handler.insert(self, [obj])
+        elif ancestor:
+            # In a lazy Panel that is not loaded, created on load
+            ancestor._handler.insert(self, [obj])
         else:
-            setattr(self, obj._id, obj)
+            self._node.content.append(obj._node)
 
+        obj._parent = self
         self.__items.append(obj)
         return obj
 
+    def add_items(self, items: list) -> list:
+        """Add a list of items.
+
+        Like `add`, but after the window is rendered, all the items are 
+        created before the Layout arranges them once.
+
+        :param items: Element or Layout objects.
+        """
+        ancestor = self.__rendered_ancestor()
+        if self._obj:
+            self._handler.insert(self, items)
+        elif ancestor:
+            ancestor._handler.insert(self, items)
+        else:
+            for obj in items:
+                self._node.content.append(obj._node)
+
+        for obj in items:
+            obj._parent = self
+        self.__items.extend(items)
+        return items
+
     def items(self) -> list:
         """Items added to the Layout.
 
@@ -186,5 +189,40 @@ class Layout(UI):
         """
         return self.__items
 
+    def remove(self, obj: Layout | Element) -> None:
+        """Remove an item.
+
+        Removes an Element or Layout added to this Layout. After the window 
+        is rendered, its QML object is destroyed.
+
+        :param obj: Element or Layout object type
+        """
+        ancestor = self.__rendered_ancestor()
+        if self._obj:
+            self._handler.remove([obj])
+        elif ancestor and obj._node.frozen:
+            logging.error(
+                f'\n  {self._name}.remove: The item is created when the lazy '
+                'Panel is loaded, remove it after the Panel opens.')
+        elif ancestor:
+            # Added after render, waiting for the lazy Panel
+            ancestor._handler.remove([obj])
+        else:
+            self._node.content.children.remove(obj._node)
+
+        obj._parent = None
+        self.__items.remove(obj)
+
+    def __rendered_ancestor(self) -> UI | None:
+        # Nearest ancestor with a QML object, if this Layout was rendered in
+        # a lazy Panel that is not loaded. Its items are created on load.
+        if self._obj or not self._node.frozen:
+            return None
+
+        parent = self._parent
+        while parent is not None and not parent._obj:
+            parent = parent._parent
+        return parent
+
     def __str__(self) -> str:
         return "<class 'Layout'>"
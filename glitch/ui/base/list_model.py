@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+import itertools
+from collections.abc import Iterable, MutableSequence, Sequence
+
+from PySide6 import QtCore
+
+
+class ListModel(QtCore.QAbstractListModel):
+    """Python data as a Qt list model.
+
+    A mutable sequence, like a `list`, is used directly and is never 
+    copied. Other sequences, like a `tuple`, are copied to a list. An
+    iterable, like a generator, is consumed in batches when the view scrolls
+    to the end of the rows already fetched.
+
+    Each `dict` key of a row is a role, like `model.name` in QML. Other rows
+    are the 'value' role. The roles are given, or taken from the first row, 
+    and they do not change later.
+
+    The view only sees the changes made with the model methods, like
+    `append` or `remove`. After changing the sequence directly, call `reset`.
+    """
+    def __init__(
+            self, rows: Iterable = (), batch_size: int = 100,
+            roles: list = None) -> None:
+        """
+        :param rows: Sequence or iterable of rows.
+        :param batch_size: Rows consumed from an iterable in each fetch.
+        :param roles: Role names, like ['name', 'size']. Default is the keys 
+            of the first row, needed for a list that starts empty.
+        """
+        super().__init__()
+        self.__batch_size = batch_size
+        if isinstance(rows, Sequence):
+            self.__rows = (
+                rows if isinstance(rows, MutableSequence) else list(rows))
+            self.__iterator = None
+            first = rows[0] if rows else None
+        else:
+            self.__rows = []
+            self.__iterator = iter(rows)
+            self.__fetch(1)
+            first = self.__rows[0] if self.__rows else None
+
+        if roles:
+            keys = list(roles)
+        else:
+            keys = list(first) if isinstance(first, dict) else ['value']
+        self.__roles = {
+            QtCore.Qt.UserRole + num: key.encode()
+            for num, key in enumerate(keys, 1)}
+        self.__keys = {
+            role: name.decode() for role, name in self.__roles.items()}
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        """If an iterable still has rows."""
+        return self.__iterator is not None and not parent.isValid()
+
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None:
+        """Consumes the next batch of rows of an iterable."""
+        if not self.canFetchMore(parent):
+            return
+
+        rows = list(itertools.islice(self.__iterator, self.__batch_size))
+        if len(rows) < self.__batch_size:
+            self.__iterator = None
+        if not rows:
+            return
+
+        start = len(self.__rows)
+        self.beginInsertRows(
+            QtCore.QModelIndex(), start, start + len(rows) - 1)
+        self.__rows.extend(rows)
+        self.endInsertRows()
+
+    def append(self, row: any) -> None:
+        """Adds a row after the last row and updates the view.
+
+        :param row: New row, with the same keys as the first row.
+        """
+        self.insert(len(self.__rows), row)
+
+    def insert(self, index: int, row: any) -> None:
+        """Adds a row before an index and updates the view.
+
+        :param index: Row index, like `list.insert`.
+        :param row: New row, with the same keys as the first row.
+        """
+        size = len(self.__rows)
+        index = max(0, size + index) if index < 0 else min(index, size)
+        self.beginInsertRows(QtCore.QModelIndex(), index, index)
+        self.__rows.insert(index, row)
+        self.endInsertRows()
+
+    def remove(self, index: int) -> None:
+        """Removes the row of an index and updates the view.
+
+        :param index: Row index, negative from the end.
+        """
+        index = range(len(self.__rows))[index]
+        self.beginRemoveRows(QtCore.QModelIndex(), index, index)
+        del self.__rows[index]
+        self.endRemoveRows()
+
+    def update(self, index: int, row: any) -> None:
+        """Replaces the row of an index and updates the view.
+
+        :param index: Row index, negative from the end.
+        :param row: New row, with the same keys as the first row.
+        """
+        index = range(len(self.__rows))[index]
+        self.__rows[index] = row
+        model_index = self.index(index)
+        self.dataChanged.emit(model_index, model_index)
+
+    def reset(self) -> None:
+        """Updates the view after changes made directly to the sequence."""
+        self.beginResetModel()
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = None) -> int:
+        """Number of rows, fetched rows for an iterable."""
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.__rows)
+
+    def data(self, index: QtCore.QModelIndex, role: int) -> any:
+        """Value of a row role."""
+        if not index.isValid() or role not in self.__keys:
+            return None
+
+        row = self.__rows[index.row()]
+        if isinstance(row, dict):
+            return row.get(self.__keys[role])
+        return row
+
+    def roleNames(self) -> dict:
+        """Role names used in QML."""
+        return self.__roles
+
+    def __fetch(self, count: int) -> None:
+        # First rows, before the view exists
+        rows = list(itertools.islice(self.__iterator, count))
+        if len(rows) < count:
+            self.__iterator = None
+        self.__rows.extend(rows)
+
+    def __str__(self) -> str:
+        return "<class 'ListModel'>"
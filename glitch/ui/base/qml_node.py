@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+import io
+import logging
+
+
+class QmlNode(object):
+    """QML object node.
+
+    A structured QML object, like `Button { ... }`, with its type, id,
+    objectName, properties and children. The wrapper classes write their
+    properties into the node, and the QML code is only generated when the
+    node is rendered.
+    """
+    def __init__(self, type_: str, id_: str = None) -> None:
+        """
+        :param type_: QML object type, like 'Button' or 'ColumnLayout'.
+        :param id_: QML id, also used as objectName.
+        """
+        self.type = type_
+        self.id = id_
+        self.object_name = id_
+        self.imports = []
+        self.declarations = {}
+        self.properties = {}
+        self.children = []
+        self.content = self
+        self.frozen = False
+
+    def append(self, child: 'QmlNode | str') -> 'QmlNode | str':
+        """Add a child.
+
+        A child is another `QmlNode` or a raw QML code block. In raw code,
+        '<id>' is replaced by the id of this node when rendered.
+
+        :param child: QmlNode or QML code string.
+        """
+        self.children.append(child)
+        return child
+
+    def declare(self, name: str, type_: str, value: any) -> None:
+        """Declare a custom property.
+
+            # property int borderWidth: 1
+            node.declare('borderWidth', 'int', 1)
+
+        :param name: Property name.
+        :param type_: QML property type, like 'int' or 'color'.
+        :param value: Initial property value.
+        """
+        self.declarations[name] = type_
+        self.set(name, value)
+
+    def find(self, id_: str) -> 'QmlNode | None':
+        """Find a child node by its id.
+
+        :param id_: QML id of the child node.
+        """
+        for child in self.children:
+            if isinstance(child, QmlNode):
+                if child.id == id_:
+                    return child
+
+                node = child.find(id_)
+                if node:
+                    return node
+        return None
+
+    def freeze(self) -> None:
+        """Marks this node and its child nodes as rendered.
+
+        The QML objects are created from the rendered code, so a later 
+        change of a frozen node is lost and is logged as an error. Like a 
+        property of an Element in a lazy Panel that is not loaded.
+        """
+        self.frozen = True
+        for node in self.children + list(self.properties.values()):
+            if isinstance(node, QmlNode):
+                node.freeze()
+
+    def get(self, name: str) -> str | None:
+        """Property value as QML code.
+
+        :param name: Property name.
+        """
+        return self.properties.get(name)
+
+    def set(self, name: str, value: any) -> None:
+        """Set a property value.
+
+        `bool` values are converted to QML 'true' or 'false', `QmlNode`
+        values are rendered as object properties, and any other value is
+        used as QML code. Strings must be quoted by the caller:
+
+            node.set('text', '"Hello"')
+            node.set('fillWidth', True)
+            node.set('background', QmlNode('Rectangle'))
+
+        :param name: Property name, like 'width' or 'Layout.fillWidth'.
+        :param value: Property value.
+        """
+        if self.frozen:
+            logging.error(
+                f'\n  {self.type} "{self.object_name}": The "{name}" change '
+                'is lost, the QML object does not exist, like in a lazy Panel '
+                'that is not loaded.')
+
+        if isinstance(value, bool):
+            value = 'true' if value else 'false'
+        elif not isinstance(value, QmlNode):
+            value = str(value)
+
+        self.properties[name] = value
+
+    def render(self, indent: int = 0) -> str:
+        """QML code of this node and its children.
+
+        :param indent: Number of spaces in front of each line.
+        """
+        buffer = io.StringIO()
+        self.write(buffer, indent)
+        return buffer.getvalue()
+
+    def without(self, nodes: list) -> 'QmlNode':
+        """Copy of this node without some child nodes.
+
+        The child nodes are removed at any depth. The other nodes are copied,
+        but the property values are shared.
+
+        :param nodes: Child QmlNodes to leave out.
+        """
+        node = QmlNode(self.type, self.id)
+        node.object_name = self.object_name
+        node.imports = list(self.imports)
+        node.declarations = dict(self.declarations)
+        node.properties = dict(self.properties)
+        for child in self.children:
+            if isinstance(child, QmlNode):
+                if any(child is skip for skip in nodes):
+                    continue
+                child = child.without(nodes)
+            node.children.append(child)
+        return node
+
+    def write(self, stream: io.TextIOBase, indent: int = 0) -> None:
+        """Write the QML code of this node and its children.
+
+        The tree is walked only once and each line is written directly to
+        the stream, like a file handle or an `io.StringIO` buffer.
+
+        :param stream: Text stream with a `write` method.
+        :param indent: Number of spaces in front of each line.
+        """
+        tab = ' ' * indent
+        for line in self.imports:
+            stream.write(f'{tab}{line}\n' if line else '\n')
+        if self.imports:
+            stream.write('\n')
+
+        stream.write(f'{tab}{self.type} {{\n')
+        self.__write_body(stream, indent + 4)
+        stream.write(f'{tab}}}\n')
+
+    def __write_body(self, stream: io.TextIOBase, indent: int) -> None:
+        # Id, properties and children lines
+        tab = ' ' * indent
+        if self.id:
+            stream.write(f'{tab}id: {self.id}\n')
+        if self.object_name:
+            stream.write(f'{tab}objectName: "{self.object_name}"\n')
+
+        for name, value in self.properties.items():
+            if name in self.declarations:
+                name = f'property {self.declarations[name]} {name}'
+
+            if isinstance(value, QmlNode):
+                stream.write(f'{tab}{name}: {value.type} {{\n')
+                value.__write_body(stream, indent + 4)
+                stream.write(f'{tab}}}\n')
+            else:
+                stream.write(f'{tab}{name}: {value}\n')
+
+        for child in self.children:
+            stream.write('\n')
+            if isinstance(child, QmlNode):
+                child.write(stream, indent)
+            else:
+                code = child.replace('<id>', self.id) if self.id else child
+                for line in code.strip('\n').split('\n'):
+                    stream.write(f'{tab}{line}\n' if line else '\n')
+
+    def __str__(self) -> str:
+        return "<class 'QmlNode'>"
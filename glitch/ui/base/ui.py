@@ -1,58 +1,36 @@
 #!/usr/bin/env python3
+from PySide6 import QtCore, QtQml
 
-
-qml_code = """
-Item {
-    id: ui  // ID
-    objectName: "ui"  // Object name
-    property string qmlType: "UI"  // Class Name
-    property string baseClass: "UI"  // Base class name
-
-    // Element header
-
-    height: 30
-    width: 100
-
-    property int alignment: Qt.AlignHCenter
-    Layout.alignment: alignment
-
-    property bool fillWidth: true
-    property bool fillHeight: false
-    Layout.fillWidth: fillWidth
-    Layout.fillHeight: fillHeight
-    
-    Layout.preferredWidth: width
-    Layout.preferredHeight: height
-
-    // Layout header
-
-    property int topMargin: 0
-    property int rightMargin: 0
-    property int bottomMargin: 0
-    property int leftMargin: 0
-    Layout.topMargin: topMargin
-    Layout.rightMargin: rightMargin
-    Layout.bottomMargin: bottomMargin
-    Layout.leftMargin: leftMargin
-
-    // Frame header
-
-    // Property
-}
-"""
+from .qml_node import QmlNode
 
 
 class UI(object):
     """A visual element object.
 
-    Elements are visual and interactive application items such as buttons and 
+    Elements are visual and interactive application items such as buttons and
     text.
     """
     def __init__(self, *args, **kwargs) -> None:
-        self.__qml = qml_code
+        self.__node = QmlNode('Item')
+        self.__node.declare('qmlType', 'string', '"UI"')
+        self.__node.declare('baseClass', 'string', '"UI"')
         self.__obj = None
+        self.__parent = None
         self.class_id('UI')
 
+    @property
+    def _handler(self) -> QtCore.QObject | None:
+        """Application Handler.
+
+        Found in the 'logic' context property of the QML engine, after the 
+        window is rendered.
+        """
+        if not self.__obj:
+            return None
+
+        engine = QtQml.qmlEngine(self.__obj)
+        return engine.rootContext().contextProperty('logic') if engine else None
+
     @property
     def _id(self) -> str:
         """Element identifier."""
@@ -60,16 +38,8 @@ class UI(object):
 
     @_id.setter
     def _id(self, id_: int) -> None:
-        qml_lines = []
-        for line in self.__qml.split('\n'):
-            if line.strip().endswith('// ID'):
-                qml_lines.append(f'    id: {id_}  // ID')
-            elif line.strip().endswith('// Object name'):
-                qml_lines.append(f'    objectName: "{id_}"  // Object name')
-            else:
-                qml_lines.append(line)
-
-        self.__qml = '\n'.join(qml_lines)  # .replace('<suffix_id>', id_)
+        self.__node.id = id_
+        self.__node.object_name = id_
         self.__id = id_
 
     @property
@@ -79,17 +49,25 @@ class UI(object):
 
     @_name.setter
     def _name(self, name: str) -> None:
-        qml_lines = []
-        for line in self.__qml.split('\n'):
-            if line.strip().endswith('// Class Name'):
-                qml_lines.append(
-                    f'    property string qmlType: "{name}"  // Class Name')
-            else:
-                qml_lines.append(line)
-
-        self.__qml = '\n'.join(qml_lines)
+        self.__node.declare('qmlType', 'string', f'"{name}"')
         self.__name = name
 
+    @property
+    def _node(self) -> QmlNode:
+        """Qml node.
+
+        Internal structured Qml handled by the wrapper class. The properties
+        are written into the node before the window is rendered.
+        """
+        return self.__node
+
+    @_node.setter
+    def _node(self, node: QmlNode) -> None:
+        # The new node keeps the element id and type name
+        self.__node = node
+        self._id = self.__id
+        self._name = self.__name
+
     @property
     def _obj(self) -> str:
         """Qt Object.
@@ -102,21 +80,30 @@ class UI(object):
     def _obj(self, obj: str) -> None:
         self.__obj = obj
 
+    @property
+    def _parent(self) -> object:
+        """Layout or Frame where this item was added, or `None`."""
+        return self.__parent
+
+    @_parent.setter
+    def _parent(self, parent: object) -> None:
+        self.__parent = parent
+
     @property
     def _qml(self) -> str:
         """Qml code.
 
-        Internal Qml handled by the wrapper class.
+        Internal Qml rendered from the `_node`.
         """
-        return self.__qml
-
-    @_qml.setter
-    def _qml(self, qml: str) -> None:
-        self.__qml = qml
+        return self.__node.render()
 
     def class_id(self, name: str) -> None:
-        """..."""
-        self._id = '_' + str(id(self))
+        """Sets the element type name.
+
+        The id is the lowercase type name until the Application replaces it 
+        with the element path in the Frame tree, like '_0_2_1'.
+        """
+        self._id = name.lower()
         self._name = name
 
 
@@ -1,27 +1,10 @@
 #!/usr/bin/env python3
 import pathlib
 
-from xdg import IconTheme
-
 from ..base import Element
 from ...enum.event import Event
-from ...platform_ import OSDesk, Icons
-
-
-header = """
-Button {
-    id: button  // ID
-    objectName: "button"  // Object name
-    property string qmlType: "Button"  // Class Name
-    property string baseClass: "Element"  // Base class name
-    
-    // Element header
-"""
-
-properties = """
-    text: "<text>"
-    iconSource: <icon>
-"""
+from ...platform_ import IconResolver
+from ...tools import RateLimit
 
 
 class Button(Element):
@@ -35,18 +18,20 @@ class Button(Element):
         super().__init__(*args, **kwargs)
         self.__callbacks = {}
         self.__path = pathlib.Path(__file__).parent.parent.parent
-        self.__icon_path = self.__path / 'static' / 'icons' / 'linux'
-        self.__platform_icons = Icons(OSDesk().desktop_environment)
 
         # Args
         self.__text = text
         self.__icon = self.__set_icon_path(icon)
 
         # QML
-        qml = properties.replace(
-            '<text>', self.__text).replace('<icon>', self.__icon)
-        self._qml = header + self._qml.split('// Element header')[1]
-        self._qml = self._qml.replace('\n    // Property', qml)
+        self._node.type = 'Button'
+        self._node.set('text', f'"{self.__text}"')
+        self._node.set('iconSource', self.__icon)
+        self._style_targets = {
+            '': ('backgroundColor', 'borderColor'),
+            'textItem': ('color',),
+            'background': ('backgroundColor', 'borderColor'),
+            'iconItem': ('opacity',)}
         self.class_id('Button')
 
         # Properties
@@ -65,9 +50,6 @@ class Button(Element):
             return
         
         icon = self.__path/'static'/'icons'/f'{name}.svg'
-        self._qml = self._qml.replace(
-            f'\n    iconSource: "{self.__icon}"',
-            f'\n    iconSource: "{icon}"')
         self.__icon = icon
 
     @property
@@ -83,9 +65,7 @@ class Button(Element):
             self._obj.setProperty('text', text)
             return
         
-        self._qml = self._qml.replace(
-            f'\n    text: "{self.__text}"',
-            f'\n    text: "{text}"')
+        self._node.set('text', f'"{text}"')
         self.__text = text
 
     def callbacks(self) -> dict:
@@ -97,24 +77,33 @@ class Button(Element):
         return self.__callbacks
 
     def connect(
-            self, method: callable, event: Event = Event.MOUSE_PRESS) -> None:
+            self, method: callable, event: Event = Event.MOUSE_PRESS,
+            throttle_ms: int = 0, debounce_ms: int = 0,
+            coalesce: bool = False) -> None:
         """Connect the button to a method.
 
         Pass a method to be executed when interacting with the button.
         Alternatively, use an event like `Event.MOUSE_HOVER` or 
         `Event.MOUSE_WHEEL` to configure when the button will use the method.
 
+        A heavy method for a frequent event can be limited:
+
+            button.connect(self.on_hover, Event.MOUSE_HOVER, throttle_ms=100)
+
         :param method: method to be executed when interacting with the button.
         :param event: Enum like `Event.MOUSE_HOVER` or `Event.MOUSE_WHEEL`
+        :param throttle_ms: Call at once, then at most once per interval.
+        :param debounce_ms: Call when there were no events for this time.
+        :param coalesce: Call at most once per rendered frame.
         """
+        if throttle_ms or debounce_ms or coalesce:
+            method = RateLimit(method, throttle_ms, debounce_ms, coalesce)
+        self.__callbacks[event] = method
         if self._obj:
             if event == Event.MOUSE_PRESS:
                 self._obj.clicked.connect(method)
             elif event == Event.MOUSE_HOVER:
                 self._obj.hoveredChanged.connect(method)
-            return
-
-        self.__callbacks[event] = method
 
     def is_mouse_hover(self) -> bool:
         """If the mouse is hovering over this button.
@@ -136,18 +125,9 @@ class Button(Element):
             return f'"{icon_name}"'
 
         else:
-            icon_path = IconTheme.getIconPath(
-                iconname=icon_name,
-                size=16,
-                theme=self.__platform_icons.icon_theme(),
-                extensions=['png', 'svg', 'xpm'])
-
-            if icon_path:
-                return f'"{icon_path}"'
-
-            icon = icon_name + '.svg'
-            path = self.__icon_path / icon
-            return f'"{path}"' if path.exists() else '""'
+            # Theme icon, or the library icon, cached by the process
+            icon_path = IconResolver.shared().path(icon_name, 16)
+            return f'"{icon_path}"' if icon_path else '""'
                 # impl callback
         """
         IconTheme.getIconPath(
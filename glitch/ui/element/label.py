@@ -3,27 +3,6 @@ from ..base import Element
 from ...enum import Size
 
 
-header = """
-Label {
-    id: label  // ID
-    objectName: "label"  // Object name
-    property string qmlType: "Label"  // Class Name
-    property string baseClass: "Element"  // Base class name
-
-    // Element header
-"""
-
-properties = """
-    text: "<text>"
-    color: "#fff"
-
-    // Layout.fillWidth: true
-    // Layout.preferredHeight: 80
-    // horizontalAlignment: Text.AlignHCenter
-    // verticalAlignment: Text.AlignVCenter
-"""
-
-
 class Label(Element):
     """Label Element"""
     def __init__(
@@ -36,9 +15,10 @@ class Label(Element):
         self.__text = text
 
         # QML
-        qml = properties.replace('<text>', self.__text)
-        self._qml = header + self._qml.split('// Element header')[1]
-        self._qml = self._qml.replace('\n    // Property', qml)
+        self._node.type = 'Label'
+        self._node.set('text', f'"{self.__text}"')
+        self._node.set('color', '"#fff"')
+        self._style_targets = {'': ('color',)}
         self.class_id('Label')
 
         # Properties
@@ -55,9 +35,7 @@ class Label(Element):
         if self._obj:
             self._obj.setProperty('text', text)
         else:
-            self._qml = self._qml.replace(
-                f'\n    text: "{self.__text}"',
-                f'\n    text: "{text}"')
+            self._node.set('text', f'"{text}"')
         
         self.__text = text
 
@@ -2,31 +2,29 @@
 from ..base import Frame
 
 
-qml = """
-// MainFrame
-        // Drag area
-        Rectangle {
-            id: dragArea
-            objectName: "dragArea"
-            // width: parent.width
-            // width: parent.width - 20
-            height: 20
-            anchors {
-                top: parent.top
-                left: parent.left
-                right: parent.right
-                margins: 5  // margem de 10px nas laterais
-            }
-            color: "transparent"
-            z: 2
+drag_area = """
+// Drag area
+Rectangle {
+    id: dragArea
+    objectName: "dragArea"
+    // width: parent.width
+    // width: parent.width - 20
+    height: 20
+    anchors {
+        top: parent.top
+        left: parent.left
+        right: parent.right
+        margins: 5  // margem de 10px nas laterais
+    }
+    color: "transparent"
+    z: 2
 
-            MouseArea {
-                anchors.fill: parent
-                drag.target: mainRect
-                onPressed: logic.start_move()
-            }
-        }
-// MainFrame
+    MouseArea {
+        anchors.fill: parent
+        drag.target: mainRect
+        onPressed: logic.start_move()
+    }
+}
 """
 
 
@@ -40,8 +38,8 @@ class MainFrame(Frame):
     """
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(resizable=True, *args, **kwargs)
-        qml_init, qml_end = self._qml.split('// MainFrame')
-        self._qml = qml_init + qml + qml_end
+        # Between the canvas and the resize corners
+        self._node.find('mainRect').children.insert(1, drag_area)
         self.class_id('MainFrame')
 
     def __str__(self) -> str:
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 from .column import Column
+from .list_scroll import ListScroll
 from .panel import Panel
 from .row import Row
 from .scroll import Scroll
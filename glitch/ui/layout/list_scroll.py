@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+import logging
+from collections.abc import Iterable
+
+from ..base import Element, Layout
+from ..base.list_model import ListModel
+from ..base.qml_node import QmlNode
+from ..element import Label
+
+
+background = """
+Rectangle {
+    anchors.fill: parent
+    z: -1
+    color: "#22000000"
+    radius: 4
+}
+"""
+
+
+class ListScroll(Layout):
+    """Scrollable list of rows from Python data.
+
+    It is a type like `Scroll` object, but the rows are items of a sequence 
+    or iterable, displayed with a template Element. Only the visible rows 
+    are created, and they are reused when scrolling, so a list with 50k rows 
+    starts as fast as a list with 10 rows.
+
+        rows = ({'name': f'Row {num}'} for num in range(50_000))
+        self.add(ListScroll(rows, Label(), {'text': 'name'}))
+
+    Rows are added, removed or replaced with the `model` methods, so the 
+    view is updated:
+
+        self.list_scroll.model.append({'name': 'New row'})
+
+    The view does not see the changes made directly to the sequence, call 
+    `model.reset()` after them.
+
+    The rows are QML items created by the ListView from the template, not 
+    Elements. They are not registered in the Handler, so the hover and 
+    pressed styles of the style sheet and the `connect` callbacks of the 
+    template are not used for them.
+    """
+    def __init__(
+            self, rows: Iterable = (), template: Element = None,
+            bindings: dict = None, *args, **kwargs) -> None:
+        """
+        :param rows: Sequence or iterable of rows. A `dict` row has a role 
+            for each key, other rows have the 'value' role. The roles are 
+            the ones used in `bindings`.
+        :param template: Element used to display each row. Default is Label.
+        :param bindings: Template property and row role, like 
+            {'text': 'name'}. Default is {'text': 'value'}.
+        """
+        super().__init__(*args, **kwargs)
+        # Args
+        self.__template = template if template else Label()
+        self.__bindings = bindings if bindings else {'text': 'value'}
+        # The bound roles exist also when the rows start empty
+        self.__model = ListModel(
+            rows, roles=list(dict.fromkeys(self.__bindings.values())))
+
+        # QML
+        self._node = QmlNode('ListView')
+        self._node.declare('baseClass', 'string', '"Layout"')
+        self._node.set('Layout.fillWidth', True)
+        self._node.set('Layout.fillHeight', True)
+        self._node.set('clip', True)
+        self._node.set('spacing', 6)
+        self._node.set('reuseItems', True)
+        for margin in 'topMargin', 'rightMargin', 'bottomMargin', 'leftMargin':
+            self._node.declare(margin, 'int', 0)
+            self._node.set(f'Layout.{margin}', margin)
+        self._node.set('ScrollBar.vertical', QmlNode('ScrollBar'))
+        self._node.append(background)
+
+        delegate = self.__template._node
+        # Not styled or connected by the Handler
+        delegate.declare('listDelegate', 'bool', True)
+        delegate.set('width', 'ListView.view.width')
+        for name, role in self.__bindings.items():
+            delegate.set(name, f'model.{role}')
+        self._node.set('delegate', delegate)
+        self.class_id('ListScroll')
+
+    @property
+    def _obj(self) -> object:
+        """Qt Object.
+
+        Internal object manipulated by the wrapper class. The rows model is 
+        set when the object is set.
+        """
+        return Layout._obj.fget(self)
+
+    @_obj.setter
+    def _obj(self, obj: object) -> None:
+        Layout._obj.fset(self, obj)
+        if obj:
+            obj.setProperty('model', self.__model)
+
+    @property
+    def model(self) -> ListModel:
+        """The rows as a Qt list model."""
+        return self.__model
+
+    def add(self, obj: Layout | Element) -> Layout | Element:
+        """Not used, rows are added to the data."""
+        logging.error(
+            f'\n  {self._name}.add: Items are created from the rows and the '
+            'template.')
+        return obj
+
+    def __str__(self) -> str:
+        return "<class 'ListScroll'>"
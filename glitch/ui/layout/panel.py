@@ -4,96 +4,95 @@ import logging
 from PySide6 import QtCore
 
 from ..base import Layout
+from ..base.qml_node import QmlNode
 from ...enum import Align
 
 
-qml = """
-Popup {
-    id: panel  // ID
-    objectName: "panel"  // Object name
-    property string qmlType: "Panel"  // Class Name
-    property string baseClass: "Layout"  // Base class name
-
-    padding: 1 // Frame border
-    width: 250
-    height: parent.height + 9 // Frame padding (10) - Popup padding (1) = 9
-    x: 0
-    y: - 4  // Half of the Frame padding - outer border
-    modal: false
-    closePolicy: Popup.CloseOnEscape | Popup.CloseOnPressOutside
-    clip: true
-
-    transformOrigin: Item.Left
-
-    property int parentHeight: parent.height + 9
-    property int parentWidth: parent.width + 9
-
-    property color backgroundColor: "#222"
-    property color borderColor: "#222"
-    property int borderWidth: 1
+canvas = """
+Canvas {
+    id: canvas<id>
+    objectName: "canvas<id>"
+    anchors.fill: parent
+
+    onPaint: {
+        var ctx = getContext("2d");
+        ctx.clearRect(0, 0, width, height);
+
+        ctx.beginPath();
+        ctx.moveTo(<id>.radiusTopLeft, 0);
+        ctx.lineTo(width - <id>.radiusTopRight, 0);
+        ctx.arcTo(width, 0, width, <id>.radiusTopRight, <id>.radiusTopRight);
+        ctx.lineTo(width, height - <id>.radiusBottomRight);
+        ctx.arcTo(width, height, width - <id>.radiusBottomRight, height, <id>.radiusBottomRight);
+        ctx.lineTo(<id>.radiusBottomLeft, height);
+        ctx.arcTo(0, height, 0, height - <id>.radiusBottomLeft, <id>.radiusBottomLeft);
+        ctx.lineTo(0, <id>.radiusTopLeft);
+        ctx.arcTo(0, 0, <id>.radiusTopLeft, 0, <id>.radiusTopLeft);
+        ctx.closePath();
+
+        // Background color
+        ctx.fillStyle = <id>.backgroundColor;
+        ctx.fill();
+
+        // Border coloe
+        ctx.strokeStyle = <id>.borderColor;
+        ctx.lineWidth = <id>.borderWidth;
+        ctx.stroke();
+    }
+}
+"""
 
-    property int radiusTopLeft: 10
-    property int radiusTopRight: 0
-    property int radiusBottomRight: 0
-    property int radiusBottomLeft: 10
+rectangle = """
+Rectangle {
+    id: sceneBackground<id>
+    objectName: "sceneBackground<id>"
+    anchors.fill: parent
+    color: <id>.backgroundColor
+    border.color: <id>.borderColor
+    border.width: <id>.borderWidth
+    topLeftRadius: <id>.radiusTopLeft
+    topRightRadius: <id>.radiusTopRight
+    bottomRightRadius: <id>.radiusBottomRight
+    bottomLeftRadius: <id>.radiusBottomLeft
+    antialiasing: true
+}
+"""
 
-    background: Rectangle {
-        color: "#00000000"
-        radius: 0
-        border.color: "#00000000"
-        border.width: 1
-        clip: true
+transitions = """
+enter: Transition {
+    ParallelAnimation {
+        NumberAnimation {
+            property: "x"; from: <id>.hiddenX; to: <id>.shownX
+            duration: 300; easing.type: Easing.OutCubic
+        }
+        NumberAnimation {
+            property: "opacity"; from: 0; to: 1
+            duration: 300; easing.type: Easing.OutCubic
+        }
     }
+}
 
-    Canvas {
-        id: canvas_panel
-        objectName: "canvas_panel"
-        anchors.fill: parent
-
-        onPaint: {
-            var ctx = getContext("2d");
-            ctx.clearRect(0, 0, width, height);
-
-            ctx.beginPath();
-            ctx.moveTo(panel.radiusTopLeft, 0);
-            ctx.lineTo(width - panel.radiusTopRight, 0);
-            ctx.arcTo(width, 0, width, panel.radiusTopRight, panel.radiusTopRight);
-            ctx.lineTo(width, height - panel.radiusBottomRight);
-            ctx.arcTo(width, height, width - panel.radiusBottomRight, height, panel.radiusBottomRight);
-            ctx.lineTo(panel.radiusBottomLeft, height);
-            ctx.arcTo(0, height, 0, height - panel.radiusBottomLeft, panel.radiusBottomLeft);
-            ctx.lineTo(0, panel.radiusTopLeft);
-            ctx.arcTo(0, 0, panel.radiusTopLeft, 0, panel.radiusTopLeft);
-            ctx.closePath();
-
-            // Background color
-            ctx.fillStyle = panel.backgroundColor;
-            ctx.fill();
-
-            // Border coloe
-            ctx.strokeStyle = panel.borderColor;
-            ctx.lineWidth = panel.borderWidth;
-            ctx.stroke();
+exit: Transition {
+    ParallelAnimation {
+        NumberAnimation {
+            property: "x"; to: <id>.hiddenX
+            duration: 300; easing.type: Easing.InCubic
+        }
+        NumberAnimation {
+            property: "opacity"; to: 0
+            duration: 300; easing.type: Easing.InCubic
         }
     }
+}
+"""
 
-    ColumnLayout {
-        property int topMargin: 0
-        property int rightMargin: 0
-        property int bottomMargin: 0
-        property int leftMargin: 0
-        Layout.topMargin: topMargin
-        Layout.rightMargin: rightMargin
-        Layout.bottomMargin: bottomMargin
-        Layout.leftMargin: leftMargin
-        
-        spacing: 6
-
-        anchors.fill: parent
-        // anchors.margins: 6
-
-// Close
-    }
+background = """
+background: Rectangle {
+    color: "#00000000"
+    radius: 0
+    border.color: "#00000000"
+    border.width: 1
+    clip: true
 }
 """
 
@@ -103,25 +102,102 @@ class Panel(Layout):
 
     Opens and closes to display content.
     """
-    def __init__(self, align: Align = Align.LEFT, *args, **kwargs) -> None:
+    def __init__(
+            self, align: Align = Align.LEFT, lazy: bool = False,
+            unload: bool = False, *args, **kwargs) -> None:
+        """
+        :param align: Align.LEFT or Align.RIGHT, the side the Panel slides 
+            in from.
+        :param lazy: Create the Panel content only when it is first opened, 
+            instead of when the window is rendered.
+        :param unload: With `lazy`, destroy the content when the Panel is 
+            closed. It is created again on the next open.
+        """
         super().__init__(*args, **kwargs)
         # Args
         self.__align = align
+        self.__lazy = lazy
+        self.__unload = unload
         self.__origin = 'Item.Left'
 
         # QML
-        self._qml = qml.replace(
-            'canvas_panel', f'canvas{self._id}').replace('panel', self._id)
+        self._node = QmlNode('Popup')
+        self._node.declare('baseClass', 'string', '"Layout"')
+        self._node.set('padding', 1)  # Frame border
+        self._node.set('width', 250)
+        # Frame padding (10) - Popup padding (1) = 9
+        self._node.set('height', 'parent.height + 9')
+        self._node.declare('alignRight', 'bool', False)
+        # Frame padding half (5) or outer border (4), from the window side
+        self._node.declare(
+            'shownX', 'real', 'alignRight ? parentWidth - width - 4 : - 5')
+        self._node.declare(
+            'hiddenX', 'real', 'alignRight ? parentWidth : - width')
+        self._node.set('x', 'shownX')
+        self._node.set('y', '- 4')  # Half of the Frame padding - outer border
+        self._node.set('modal', False)
+        self._node.set(
+            'closePolicy', 'Popup.CloseOnEscape | Popup.CloseOnPressOutside')
+        self._node.set('clip', True)
+        self._node.set('transformOrigin', self.__origin)
+        self._node.declare('parentHeight', 'int', 'parent.height + 9')
+        self._node.declare('parentWidth', 'int', 'parent.width + 9')
+        self._node.declare('backgroundColor', 'color', '"#222"')
+        self._node.declare('borderColor', 'color', '"#222"')
+        self._node.declare('borderWidth', 'int', 1)
+        self._node.declare('radiusTopLeft', 'int', 10)
+        self._node.declare('radiusTopRight', 'int', 0)
+        self._node.declare('radiusBottomRight', 'int', 0)
+        self._node.declare('radiusBottomLeft', 'int', 10)
+        self._node.append(background)
+        self._node.append(canvas)
+        # The slide runs in the render loop, open and close only change state
+        self._node.append(transitions)
+
+        column = self._node.append(QmlNode('ColumnLayout'))
+        column.object_name = 'panelContent'
+        for margin in 'topMargin', 'rightMargin', 'bottomMargin', 'leftMargin':
+            column.declare(margin, 'int', 0)
+            column.set(f'Layout.{margin}', margin)
+        column.set('spacing', 6)
+        column.set('anchors.fill', 'parent')
+        if lazy:
+            # The content is a Component, created by the Loader on open
+            self._node.children.remove(column)
+            loader = self._node.append(QmlNode('Loader'))
+            loader.object_name = 'panelLoader'
+            loader.set('anchors.fill', 'parent')
+            loader.set('active', False)
+            loader.set('asynchronous', False)
+            component = QmlNode('Component')
+            component.append(column)
+            loader.set('sourceComponent', component)
+        self._node.content = column
         self.align = align
         self.class_id('Panel')
 
         # Properties
-        self.__show_anim = QtCore.QParallelAnimationGroup()
-        # self.__hide_anim = QtCore.QParallelAnimationGroup()
-        self.__is_open = False
         self.__connect_close = False
 
         self.__radius = 10, 0, 0, 10
+        self.__scene_graph = False
+
+    @property
+    def _scene_graph(self) -> bool:
+        """Scene graph background.
+
+        If `True`, the background is a Rectangle with radius per corner, 
+        instead of a Canvas painted with JavaScript. Requires Qt 6.7 or 
+        later. Set before the window is rendered.
+        """
+        return self.__scene_graph
+
+    @_scene_graph.setter
+    def _scene_graph(self, scene_graph: bool) -> None:
+        old, new = (canvas, rectangle) if scene_graph else (rectangle, canvas)
+        if old in self._node.children:
+            self._node.children[self._node.children.index(old)] = new
+        self.__scene_graph = scene_graph
 
     def __get_origin(self) -> str:
         # transform_origin QML string
@@ -146,12 +222,12 @@ class Panel(Layout):
     def align(self, align: Align) -> None:
         self.__align = align
 
-        new_origin = self.__get_origin()
-        self._qml = self._qml.replace(
-            f'transformOrigin: {self.__origin}',
-            f'transformOrigin: {new_origin}')
-
-        self.__origin = new_origin
+        self.__origin = self.__get_origin()
+        self._node.set('transformOrigin', self.__origin)
+        if self._obj:
+            self._obj.setProperty('alignRight', align.name == 'RIGHT')
+        else:
+            self._node.set('alignRight', align.name == 'RIGHT')
 
     @property
     def radius(self) -> tuple:
@@ -225,28 +301,26 @@ class Panel(Layout):
             self._obj.findChild(QtCore.QObject, 'canvas').requestPaint()
             
         else:
-            self._qml = self._qml.replace(
-                f'property int radiusTopLeft: {self.__radius[0]}',
-                f'property int radiusTopLeft: {top_l}')
-            self._qml = self._qml.replace(
-                f'property int radiusTopRight: {self.__radius[1]}',
-                f'property int radiusTopRight: {top_r}')
-            self._qml = self._qml.replace(
-                f'property int radiusBottomRight: {self.__radius[2]}',
-                f'property int radiusBottomRight: {bottom_r}')
-            self._qml = self._qml.replace(
-                f'property int radiusBottomLeft: {self.__radius[3]}',
-                f'property int radiusBottomLeft: {bottom_l}')
+            self._node.set('radiusTopLeft', top_l)
+            self._node.set('radiusTopRight', top_r)
+            self._node.set('radiusBottomRight', bottom_r)
+            self._node.set('radiusBottomLeft', bottom_l)
 
         self.__radius = top_l, top_r, bottom_r, bottom_l
 
+    @property
+    def lazy(self) -> bool:
+        """If the content is only created when the Panel is first opened."""
+        return self.__lazy
+
     def close(self) -> None:
         """Closes the Panel.
 
-        Makes the Panel invisible.
+        Slides the Panel out and makes it invisible. With `unload`, the 
+        content is destroyed when the Panel is closed.
         """
-        self._obj.close()
-        self.__is_open = False
+        if self._obj:
+            self._obj.close()
 
     def open(self) -> None:
         """Open and display the Panel.
@@ -262,57 +336,28 @@ class Panel(Layout):
             return
 
         if not self.__connect_close:
-            self._obj.closed.connect(self.close)
+            self._obj.closed.connect(self.__closed)
             self.__connect_close = True
 
-        parent_w = self._obj.property('parentWidth')
-        parent_h = self._obj.property('parentHeight')
-        size = self._obj.property('width')
+        if self.__lazy:
+            loader = self._obj.findChild(QtCore.QObject, 'panelLoader')
+            if not loader.property('active'):
+                loader.setProperty('active', True)
+                self._handler.integrate(self)
 
-        start_value = - self._obj.property('width')  # default is -250
-        end_value = - 5  # Frame padding half | 10
-        if self.__align.name == 'RIGHT':
-            start_value = parent_w
-            end_value = parent_w - size - 4
-
-        slide_in = QtCore.QPropertyAnimation(self._obj, b"x")
-        slide_in.setDuration(300)
-        slide_in.setStartValue(start_value)
-        slide_in.setEndValue(end_value)
-        slide_in.setEasingCurve(QtCore.QEasingCurve.OutCubic)
-        fade_in = QtCore.QPropertyAnimation(self._obj, b"opacity")
-        fade_in.setDuration(300)
-        fade_in.setStartValue(0)
-        fade_in.setEndValue(1)
-        fade_in.setEasingCurve(QtCore.QEasingCurve.OutCubic)
-        self.__show_anim.addAnimation(slide_in)
-        self.__show_anim.addAnimation(fade_in)
-
-        # slide_out = QtCore.QPropertyAnimation(self._obj, b"x")
-        # slide_out.setDuration(300)
-        # slide_out.setStartValue(0)
-        # slide_out.setEndValue(250)
-        # slide_out.setEasingCurve(QtCore.QEasingCurve.InCubic)
-        # fade_out = QtCore.QPropertyAnimation(self._obj, b"opacity")
-        # fade_out.setDuration(300)
-        # fade_out.setStartValue(1)
-        # fade_out.setEndValue(0)
-        # fade_out.setEasingCurve(QtCore.QEasingCurve.InCubic)
-        # self.__hide_anim.addAnimation(slide_out)
-        # self.__hide_anim.addAnimation(fade_out)
-
-        if not self.__is_open:
-            self.__is_open = True
-            self._obj.open()
-            self.__show_anim.start()
-
-            # self.__hide_anim.finished.disconnect(on_done)
-            # self.__hide_anim.finished.connect(on_done)
-            # self.__hide_anim.start()
-
-        # Hack
         self._obj.open()
-        self.__show_anim.start()
+
+    def __closed(self) -> None:
+        # After the exit transition, or a close by Escape or a press outside
+        if not self.__lazy or not self.__unload:
+            return
+
+        loader = self._obj.findChild(QtCore.QObject, 'panelLoader')
+        # Without a handler, the window is being destroyed
+        handler = self._handler
+        if handler and loader.property('active'):
+            handler.forget(self)
+            loader.setProperty('active', False)
 
     def __str__(self) -> str:
         return "<class 'Panel'>"
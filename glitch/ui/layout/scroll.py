@@ -1,45 +1,12 @@
 #!/usr/bin/env python3
 from ..base import Layout
+from ..base.qml_node import QmlNode
 
 
-qml = """
-ScrollView {
-    id: scroll  // ID
-    objectName: "scroll"  // Object name
-    property string qmlType: "Scroll"  // Class Name
-    property string baseClass: "Layout"  // Base class name
-
-    Layout.fillWidth: true
-    Layout.fillHeight: true
-    clip: true
-    contentWidth: availableWidth
-
-    Layout.topMargin: topMargin
-    Layout.rightMargin: rightMargin
-    Layout.bottomMargin: bottomMargin
-    Layout.leftMargin: leftMargin
-    property int topMargin: 0
-    property int rightMargin: 0
-    property int bottomMargin: 0
-    property int leftMargin: 0
-
-    background: Rectangle {
-        color: "#22000000"
-        radius: 4
-    }
-
-    ColumnLayout {
-        id: scrollColumn
-        objectName: "scrollColumn"
-
-        // width: parent.width
-        // Layout.fillWidth: true
-        width: parent.width
-        spacing: 6
-
-// Close
-    }
-
+background = """
+background: Rectangle {
+    color: "#22000000"
+    radius: 4
 }
 """
 # Python set 
@@ -54,7 +21,22 @@ class Scroll(Layout):
     """
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self._qml = qml
+        # QML
+        self._node = QmlNode('ScrollView')
+        self._node.declare('baseClass', 'string', '"Layout"')
+        self._node.set('Layout.fillWidth', True)
+        self._node.set('Layout.fillHeight', True)
+        self._node.set('clip', True)
+        self._node.set('contentWidth', 'availableWidth')
+        for margin in 'topMargin', 'rightMargin', 'bottomMargin', 'leftMargin':
+            self._node.declare(margin, 'int', 0)
+            self._node.set(f'Layout.{margin}', margin)
+        self._node.append(background)
+
+        column = self._node.append(QmlNode('ColumnLayout', 'scrollColumn'))
+        column.set('width', 'parent.width')
+        column.set('spacing', 6)
+        self._node.content = column
         self.class_id('Scroll')
 
     def __str__(self) -> str:
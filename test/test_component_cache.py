@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import os
+import pathlib
+import sys
+import unittest
+
+import shiboken6
+from PySide6 import QtCore
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from glitch.core import Application
+from glitch.ui import Button, Column, MainFrame
+
+
+class View(MainFrame):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.column = self.add(Column())
+
+
+class ComponentCacheTest(unittest.TestCase):
+    pool_size = 0
+
+    @classmethod
+    def setUpClass(cls):
+        cls.application = Application(
+            View, qml_cache=False, pool_size=cls.pool_size)
+        cls.app = cls.application.frame()
+
+    def setUp(self):
+        self.calls = []
+
+    def replace(self) -> tuple:
+        # Adds a Button, removes it and adds another Button
+        first = Button('First')
+        first.connect(lambda: self.calls.append('first'))
+        self.app.column.add(first)
+        obj = first._obj
+        obj.setProperty('text', 'Changed')
+        self.app.column.remove(first)
+        QtCore.QCoreApplication.sendPostedEvents(
+            None, QtCore.QEvent.DeferredDelete)
+
+        second = Button('Second')
+        second.connect(lambda: self.calls.append('second'))
+        self.app.column.add(second)
+        return obj, second
+
+
+class TestPool(ComponentCacheTest):
+    pool_size = 4
+
+    def test_removed_element_is_reused(self):
+        obj, second = self.replace()
+        self.assertIs(second._obj, obj)
+
+        # The literal properties are the ones of the new Element
+        self.assertEqual(obj.property('text'), 'Second')
+
+        # Only the callback of the new Element is connected
+        obj.clicked.emit()
+        self.assertEqual(self.calls, ['second'])
+
+
+class TestNoPool(ComponentCacheTest):
+    pool_size = 0
+
+    def test_removed_element_is_destroyed(self):
+        obj, second = self.replace()
+        self.assertFalse(shiboken6.isValid(obj))
+        self.assertTrue(shiboken6.isValid(second._obj))
+        self.assertEqual(second._obj.property('text'), 'Second')
+
+
+if __name__ == '__main__':
+    unittest.main()
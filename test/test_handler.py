@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+import os
+import pathlib
+import sys
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from glitch.core import Application
+from glitch.ui import Column, Label, MainFrame
+
+
+class View(MainFrame):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.column = self.add(Column())
+        self.first = self.column.add(Label('First'))
+        self.second = self.column.add(Label('Second'))
+
+
+class TestHandler(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.application = Application(View, qml_cache=False)
+        cls.app = cls.application.frame()
+
+    def test_remove_then_add_has_a_new_id(self):
+        self.app.column.remove(self.app.first)
+        label = self.app.column.add(Label('Third'))
+        self.assertNotEqual(label._id, self.app.second._id)
+        self.assertIs(self.app._objects[label._id], label._obj)
+        self.assertIs(
+            self.app._objects[self.app.second._id], self.app.second._obj)
+        self.assertEqual(label._obj.property('text'), 'Third')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+import pathlib
+import sys
+import tempfile
+import unittest
+
+from xdg import IconTheme
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from glitch.platform_.icon_index import IconIndex
+
+themes = {
+    'test': ('parent', {
+        'threshold': 'Size=18\nThreshold=2\nType=Threshold',
+        '16': 'Size=16\nType=Fixed',
+        '48': 'Size=48\nType=Fixed',
+        'scalable': 'Size=64\nMinSize=24\nMaxSize=32\nType=Scalable'}),
+    'parent': ('', {'48': 'Size=48\nType=Fixed'}),
+    'hicolor': ('', {'48': 'Size=48\nType=Fixed'})}
+
+
+class TestIconIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+        self.icondirs = IconTheme.icondirs[:]
+        IconTheme.icondirs[:] = [
+            str(self.path / 'icons'), str(self.path / 'pixmaps')]
+
+        for name, (inherits, dirs) in themes.items():
+            index = [
+                '[Icon Theme]', f'Name={name}', f'Inherits={inherits}',
+                f'Directories={",".join(dirs)}']
+            for subdir, keys in dirs.items():
+                index += ['', f'[{subdir}]', keys]
+            theme = self.path / 'icons' / name
+            theme.mkdir(parents=True)
+            (theme / 'index.theme').write_text('\n'.join(index) + '\n')
+        (self.path / 'pixmaps').mkdir()
+
+    def tearDown(self):
+        IconTheme.icondirs[:] = self.icondirs
+        self.directory.cleanup()
+
+    def icon(self, *parts: str) -> str:
+        path = self.path.joinpath(*parts)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        return str(path)
+
+    def lookup(self, name: str, size: int) -> str | None:
+        index = IconIndex('test', self.path / 'index.json')
+        index.rebuild()
+        self.assertTrue(index.wait(10))
+        return index.lookup(name, size)
+
+    def test_exact_size_first(self):
+        self.icon('icons', 'test', 'threshold', 'edit.png')
+        exact = self.icon('icons', 'test', '16', 'edit.png')
+        self.assertEqual(self.lookup('edit', 16), exact)
+
+    def test_threshold_and_scalable_range(self):
+        self.icon('icons', 'test', '16', 'edit.png')
+        threshold = self.icon('icons', 'test', 'threshold', 'edit.png')
+        scalable = self.icon('icons', 'test', 'scalable', 'edit.svg')
+        self.assertEqual(self.lookup('edit', 19), threshold)
+        self.assertEqual(self.lookup('edit', 30), scalable)
+
+    def test_closest_size(self):
+        self.icon('icons', 'test', '16', 'edit.png')
+        large = self.icon('icons', 'test', '48', 'edit.png')
+        self.assertEqual(self.lookup('edit', 40), large)
+
+    def test_theme_before_inherited(self):
+        small = self.icon('icons', 'test', '16', 'edit.png')
+        self.icon('icons', 'parent', '48', 'edit.png')
+        inherited = self.icon('icons', 'parent', '48', 'copy.png')
+        self.assertEqual(self.lookup('edit', 48), small)
+        self.assertEqual(self.lookup('copy', 48), inherited)
+
+    def test_hicolor_after_inherited(self):
+        inherited = self.icon('icons', 'parent', '48', 'edit.png')
+        self.icon('icons', 'hicolor', '48', 'edit.png')
+        hicolor = self.icon('icons', 'hicolor', '48', 'copy.png')
+        self.assertEqual(self.lookup('edit', 48), inherited)
+        self.assertEqual(self.lookup('copy', 48), hicolor)
+
+    def test_pixmaps_last(self):
+        hicolor = self.icon('icons', 'hicolor', '48', 'edit.png')
+        self.icon('pixmaps', 'edit.png')
+        pixmap = self.icon('pixmaps', 'copy.png')
+        self.assertEqual(self.lookup('edit', 16), hicolor)
+        self.assertEqual(self.lookup('copy', 16), pixmap)
+
+    def test_missing_icon(self):
+        self.assertIsNone(self.lookup('edit', 16))
+
+
+if __name__ == '__main__':
+    unittest.main()
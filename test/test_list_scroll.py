@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import os
+import pathlib
+import sys
+import unittest
+
+from PySide6 import QtCore, QtTest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from glitch.core import Application
+from glitch.ui import Button, ListScroll, MainFrame
+
+
+class View(MainFrame):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.rows = [{'name': f'Row {num}'} for num in range(5)]
+        self.template = Button()
+        self.list_scroll = self.add(
+            ListScroll(self.rows, self.template, {'text': 'name'}))
+        self.empty_scroll = self.add(ListScroll(bindings={'text': 'name'}))
+        self.button = self.add(Button('Button'))
+
+
+class TestListScroll(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.application = Application(View, qml_cache=False)
+        cls.app = cls.application.frame()
+        cls.app._obj.show()
+        QtTest.QTest.qWait(100)
+
+    def setUp(self):
+        self.app.rows[:] = [{'name': f'Row {num}'} for num in range(5)]
+        self.app.list_scroll.model.reset()
+
+    def count(self, list_scroll: ListScroll = None) -> int:
+        list_scroll = list_scroll if list_scroll else self.app.list_scroll
+        return list_scroll._obj.property('count')
+
+    def delegate(self, num: int, list_scroll: ListScroll = None) -> object:
+        list_scroll = list_scroll if list_scroll else self.app.list_scroll
+        return QtCore.QMetaObject.invokeMethod(
+            list_scroll._obj, 'itemAtIndex',
+            QtCore.Q_RETURN_ARG('QQuickItem*'), QtCore.Q_ARG(int, num))
+
+    def texts(self, list_scroll: ListScroll = None) -> list:
+        QtTest.QTest.qWait(50)
+        return [
+            self.delegate(num, list_scroll).property('text')
+            for num in range(self.count(list_scroll))]
+
+    def test_model_methods_update_the_view(self):
+        model = self.app.list_scroll.model
+        model.append({'name': 'Last'})
+        model.insert(0, {'name': 'First'})
+        model.remove(1)
+        model.update(-2, {'name': 'Changed'})
+        self.assertEqual(self.count(), 6)
+        self.assertEqual(
+            self.texts(),
+            ['First', 'Row 1', 'Row 2', 'Row 3', 'Changed', 'Last'])
+
+    def test_direct_changes_need_reset(self):
+        self.app.rows.append({'name': 'Direct'})
+        self.assertEqual(self.count(), 5)
+        self.app.list_scroll.model.reset()
+        self.assertEqual(self.count(), 6)
+
+    def test_empty_rows_use_the_bound_roles(self):
+        model = self.app.empty_scroll.model
+        model.append({'name': 'First'})
+        model.insert(0, {'name': 'Zero'})
+        self.assertEqual(self.texts(self.app.empty_scroll), ['Zero', 'First'])
+
+    def test_default_rows_are_a_list(self):
+        model = ListScroll().model
+        model.append('Row')
+        self.assertEqual(model.rowCount(), 1)
+
+    def test_delegates_are_not_registered(self):
+        # The rows are QML items, the template has no Qt object
+        self.assertIsNone(self.app.template._obj)
+        self.assertNotIn(self.app.template._id, self.app._objects)
+
+        # Only the Button element has the Handler hover and press hooks
+        signal = QtCore.SIGNAL('hoveredChanged()')
+        self.assertGreater(self.app.button._obj.receivers(signal), 0)
+        self.assertEqual(self.delegate(0).receivers(signal), 0)
+        self.assertTrue(self.delegate(0).property('listDelegate'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+import os
+import pathlib
+import sys
+import unittest
+
+from PySide6 import QtCore, QtTest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from glitch.core import Application
+from glitch.ui import Column, Label, MainFrame, Panel
+
+
+class View(MainFrame):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.panel = self.add(Panel())
+        self.panel.add(Label('Panel'))
+        self.lazy_panel = self.add(Panel(lazy=True))
+        self.column = self.lazy_panel.add(Column())
+        self.label = self.column.add(Label('Label'))
+        self.closed_panel = self.add(Panel(lazy=True))
+        self.closed_label = self.closed_panel.add(Label('Label'))
+
+
+class TestPanel(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.application = Application(View, qml_cache=False)
+        cls.app = cls.application.frame()
+
+    def objects(self) -> int:
+        return len(self.app.panel._obj.findChildren(
+            QtCore.QObject, options=QtCore.Qt.FindChildrenRecursively))
+
+    def test_transitions(self):
+        panel = self.app.panel._obj
+        self.app.panel.open()
+        QtTest.QTest.qWait(500)
+        self.assertTrue(panel.property('visible'))
+        self.assertEqual(panel.property('x'), panel.property('shownX'))
+        self.assertEqual(panel.property('opacity'), 1)
+
+        self.app.panel.close()
+        QtTest.QTest.qWait(500)
+        self.assertFalse(panel.property('visible'))
+
+    def test_open_close_creates_no_objects(self):
+        self.app.panel.open()
+        self.app.panel.close()
+        count = self.objects()
+        for _ in range(10000):
+            self.app.panel.open()
+            self.app.panel.close()
+        self.assertEqual(self.objects(), count)
+        self.assertEqual(len(self.app.panel._obj.findChildren(
+            QtCore.QAbstractAnimation)), 0)
+
+    def test_nested_add_in_unloaded_panel(self):
+        # The Column exists in the compiled content, not as an object yet
+        self.assertIsNone(self.app.column._obj)
+        label = self.app.column.add(Label('Nested'))
+        self.assertIsNone(label._obj)
+
+        self.app.lazy_panel.open()
+        self.assertIsNotNone(label._obj)
+        self.assertEqual(label._obj.property('text'), 'Nested')
+        self.assertIs(
+            label._obj.parentItem(), self.app.column._obj)
+        self.app.lazy_panel.close()
+
+    def test_setter_in_unloaded_panel_is_logged(self):
+        self.assertIsNone(self.app.closed_label._obj)
+        with self.assertLogs(level='ERROR'):
+            self.app.closed_label.text = 'Changed'
+
+
+if __name__ == '__main__':
+    unittest.main()
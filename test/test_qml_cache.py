@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+import os
+import pathlib
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from glitch.core.qml_cache import QmlCache
+
+
+class TestQmlCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def age(self, qml_path: pathlib.Path, days: int) -> None:
+        mtime = time.time() - days * 24 * 60 * 60
+        os.utime(qml_path, (mtime, mtime))
+
+    def test_same_document_same_file(self):
+        cache = QmlCache(self.path)
+        self.assertEqual(cache.file('Item {}'), cache.file('Item {}'))
+        self.assertNotEqual(cache.file('Item {}'), cache.file('Rectangle {}'))
+
+    def test_hit_keeps_modification_time(self):
+        # The QML engine compiled code is valid while the mtime is the same
+        cache = QmlCache(self.path)
+        qml_path = cache.file('Item {}')
+        self.age(qml_path, 1)
+        mtime = qml_path.stat().st_mtime_ns
+
+        cache.file('Item {}')
+        self.assertEqual(qml_path.stat().st_mtime_ns, mtime)
+        self.assertGreater(qml_path.stat().st_atime_ns, mtime)
+
+    def test_hit_survives_max_age(self):
+        cache = QmlCache(self.path, max_age=30 * 24 * 60 * 60)
+        used = cache.file('Item {}')
+        unused = cache.file('Rectangle {}')
+        self.age(used, 40)
+        self.age(unused, 40)
+
+        cache.file('Item {}')
+        cache.evict()
+        self.assertTrue(used.exists())
+        self.assertFalse(unused.exists())
+
+    def test_hit_survives_max_size(self):
+        documents = [f'Item {{ objectName: "{num}" }}' for num in range(3)]
+        size = len(documents[0])
+        cache = QmlCache(self.path, max_size=2 * size)
+        files = [cache.file(document) for document in documents]
+        for days, qml_path in enumerate(files):
+            self.age(qml_path, 3 - days)
+
+        # The oldest file is used again, the second one is now the oldest
+        cache.file(documents[0])
+        cache.evict()
+        self.assertTrue(files[0].exists())
+        self.assertFalse(files[1].exists())
+        self.assertTrue(files[2].exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
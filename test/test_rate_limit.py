@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+import os
+import pathlib
+import sys
+import unittest
+
+from PySide6 import QtTest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from glitch.core import Application, Signal
+from glitch.tools import RateLimit
+from glitch.ui import Button, MainFrame
+
+
+class View(MainFrame):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.button = self.add(Button('Button'))
+        self.calls = []
+
+    def on_value(self, value: any) -> None:
+        self.calls.append(value)
+
+
+class TestRateLimit(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.application = Application(View, qml_cache=False)
+        cls.app = cls.application.frame()
+
+    def setUp(self):
+        self.calls = []
+
+    def test_no_limit_calls_at_once(self):
+        limit = RateLimit(self.calls.append)
+        limit(1)
+        limit(2)
+        self.assertEqual(self.calls, [1, 2])
+
+    def test_throttle(self):
+        limit = RateLimit(self.calls.append, throttle_ms=100)
+        for num in range(5):
+            limit(num)
+        # The first call of a burst is not delayed
+        self.assertEqual(self.calls, [0])
+
+        QtTest.QTest.qWait(50)
+        self.assertEqual(self.calls, [0])
+        QtTest.QTest.qWait(150)
+        self.assertEqual(self.calls, [0, 4])
+
+    def test_debounce(self):
+        limit = RateLimit(self.calls.append, debounce_ms=100)
+        for num in range(3):
+            limit(num)
+            QtTest.QTest.qWait(50)
+        # Each call waits again
+        self.assertEqual(self.calls, [])
+
+        QtTest.QTest.qWait(150)
+        self.assertEqual(self.calls, [2])
+
+    def test_coalesce(self):
+        limit = RateLimit(self.calls.append, coalesce=True)
+        for num in range(5):
+            limit(num)
+        self.assertEqual(self.calls, [])
+
+        QtTest.QTest.qWait(100)
+        self.assertEqual(self.calls, [4])
+
+    def test_cancel(self):
+        limit = RateLimit(self.calls.append, debounce_ms=50)
+        limit(1)
+        limit.cancel()
+        QtTest.QTest.qWait(100)
+        self.assertEqual(self.calls, [])
+
+    def test_signal_connect(self):
+        signal = Signal(int)
+        signal.connect(self.app.on_value, debounce_ms=50)
+        for num in range(5):
+            signal.emit(num)
+        self.assertEqual(self.app.calls, [])
+
+        QtTest.QTest.qWait(100)
+        self.assertEqual(self.app.calls, [4])
+
+        # A disconnect cancels the waiting call
+        signal.emit(5)
+        signal.disconnect(self.app.on_value)
+        QtTest.QTest.qWait(100)
+        self.assertEqual(self.app.calls, [4])
+
+    def test_button_connect(self):
+        self.app.button.connect(
+            lambda: self.calls.append('clicked'), throttle_ms=100)
+        for _ in range(5):
+            self.app.button._obj.clicked.emit()
+        self.assertEqual(self.calls, ['clicked'])
+
+        QtTest.QTest.qWait(200)
+        self.assertEqual(self.calls, ['clicked', 'clicked'])
+
+
+if __name__ == '__main__':
+    unittest.main()
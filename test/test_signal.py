@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+import gc
+import pathlib
+import sys
+import threading
+import unittest
+import weakref
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from glitch.core import Signal
+from glitch.core.signal import QueuedCall
+from glitch.ui import Button, Column, Label
+
+
+class View(Column):
+    changed = Signal(object)
+
+    def __init__(self, updates: Signal, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.label = self.add(Label('Label'))
+        self.button = self.add(Button('Button'))
+        self.changed.connect(self.on_changed)
+        updates.connect(self.on_changed)
+
+    def on_changed(self, value: any) -> None:
+        self.label.text = str(value)
+
+
+class TestSignal(unittest.TestCase):
+
+    def test_typed_arguments(self):
+        values = []
+        signal = Signal(int, str)
+        signal.connect(lambda num, text: values.append((num, text)))
+        signal.emit(1, 'text')
+        self.assertEqual(values, [(1, 'text')])
+        with self.assertRaises(TypeError):
+            signal.emit(1)
+
+    def test_object_arguments(self):
+        # Python values are passed without conversion
+        values = []
+        value = {'key': [1, 2]}
+        signal = Signal(object)
+        signal.connect(values.append)
+        signal.emit(value)
+        self.assertIs(values[0], value)
+
+    def test_no_arguments(self):
+        calls = []
+        signal = Signal()
+        signal.connect(lambda: calls.append(1))
+        signal.emit()
+        self.assertEqual(calls, [1])
+        with self.assertRaises(TypeError):
+            signal.emit(1)
+
+    def test_method_disconnected_when_collected(self):
+        updates = Signal(object)
+        view = View(updates)
+        updates.emit('value')
+        self.assertEqual(view.label.text, 'value')
+
+        reference = weakref.ref(view)
+        del view
+        gc.collect()
+        self.assertIsNone(reference())
+        updates.emit('value')
+
+    def test_thread_object_deleted_when_finished(self):
+        calls = []
+        signal = Signal()
+        references = []
+
+        def connect() -> None:
+            signal.connect(lambda: calls.append(1))
+            references.append(weakref.ref(QueuedCall.current()))
+
+        thread = threading.Thread(target=connect)
+        thread.start()
+        thread.join()
+        gc.collect()
+        self.assertIsNone(references[0]())
+
+        # A new thread does not receive the calls of the finished thread
+        thread = threading.Thread(target=signal.emit)
+        thread.start()
+        thread.join()
+        signal.emit()
+        self.assertEqual(calls, [])
+
+    def test_views_do_not_leak(self):
+        updates = Signal(object)
+        views = weakref.WeakSet()
+        for num in range(10000):
+            view = View(updates)
+            views.add(view)
+            updates.emit(num)
+            del view
+        gc.collect()
+        self.assertEqual(len(views), 0)
+
+        # The collected views were disconnected
+        updates.emit('value')
+
+
+if __name__ == '__main__':
+    unittest.main()
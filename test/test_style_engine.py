@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+import os
+import pathlib
+import sys
+import unittest
+
+from PySide6 import QtCore, QtGui
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from glitch.core import Application
+from glitch.core.application import AppEventFilter
+from glitch.ui import Button, Label, MainFrame, Panel
+
+
+class View(MainFrame):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.panel = self.add(Panel())
+        self.button = self.panel.add(Button('Button'))
+        self.label_panel = self.add(Panel())
+        self.label_panel.add(Label('Label'))
+
+
+class TestStyleEngine(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.application = Application(View, qml_cache=False)
+        cls.app = cls.application.frame()
+        main_rect = cls.app._obj.findChild(QtCore.QObject, 'mainRect')
+        cls.event_filter = AppEventFilter(
+            cls.app, main_rect, cls.app.style, cls.app._objects)
+
+    def send(self, event_type: QtCore.QEvent.Type) -> None:
+        self.event_filter.eventFilter(
+            self.app._obj, QtCore.QEvent(event_type))
+
+    def color(self, obj: QtCore.QObject, name: str) -> str:
+        return QtGui.QColor(obj.property(name)).name(
+            QtGui.QColor.HexArgb).upper()
+
+    def test_mixed_panels_change_state(self):
+        # Only the first Panel has a Button with 'text' and 'icon'
+        self.send(QtCore.QEvent.WindowDeactivate)
+        for panel in self.app.panel, self.app.label_panel:
+            self.assertEqual(
+                self.color(panel._obj, 'backgroundColor'), '#EF202020')
+        self.send(QtCore.QEvent.WindowActivate)
+        for panel in self.app.panel, self.app.label_panel:
+            self.assertEqual(
+                self.color(panel._obj, 'backgroundColor'), '#EF222222')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+import os
+import pathlib
+import sys
+import threading
+import unittest
+
+from PySide6 import QtCore, QtQuick, QtTest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from glitch.core import Application, UpdateQueue
+from glitch.ui import Label, MainFrame
+
+
+class View(MainFrame):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.label = self.add(Label('Label'))
+
+
+class Element(object):
+    """Records each value and the thread that set it."""
+    def __init__(self) -> None:
+        self.values = []
+        self.threads = []
+
+    @property
+    def text(self) -> str:
+        return self.values[-1] if self.values else None
+
+    @text.setter
+    def text(self, text: str) -> None:
+        self.values.append(text)
+        self.threads.append(threading.current_thread())
+
+
+class TestUpdateQueue(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.application = Application(View, qml_cache=False)
+        cls.app = cls.application.frame()
+        cls.app._obj.show()
+        QtTest.QTest.qWaitForWindowExposed(cls.app._obj)
+
+    def test_last_value_applied(self):
+        queue = UpdateQueue()
+        element = Element()
+        for num in range(10):
+            queue.set(element, 'text', f'Value {num}')
+        QtCore.QCoreApplication.processEvents()
+        self.assertEqual(element.values, ['Value 9'])
+
+    def test_worker_thread_applied_before_frame(self):
+        window = self.app._obj
+        self.assertTrue(window.isExposed())
+        queue = UpdateQueue(window)
+        element = Element()
+        frames = QtTest.QSignalSpy(window.afterAnimating)
+
+        def worker() -> None:
+            for num in range(100):
+                queue.set(element, 'text', f'Value {num}')
+                queue.set(self.app.label, 'text', f'Value {num}')
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        for _ in range(100):
+            if element.values:
+                break
+            QtTest.QTest.qWait(10)
+        self.assertGreater(frames.count(), 0)
+        self.assertEqual(element.values, ['Value 99'])
+        self.assertEqual(element.threads, [threading.main_thread()])
+        self.assertEqual(self.app.label.text, 'Value 99')
+        queue.window = None
+
+    def test_window_not_exposed(self):
+        window = QtQuick.QQuickWindow()
+        self.assertFalse(window.isExposed())
+        queue = UpdateQueue(window)
+        element = Element()
+        queue.set(element, 'text', 'Value')
+        QtCore.QCoreApplication.processEvents()
+        self.assertEqual(element.values, ['Value'])
+
+
+if __name__ == '__main__':
+    unittest.main()